@@ -6,6 +6,7 @@ import json
 import mmap
 import string
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -15,14 +16,13 @@ if TYPE_CHECKING:
     from rich.console import Console as ConsoleType
     from rich.tree import Tree as TreeType
 else:
+    # rich 的 Console/Tree 仅用于类型标注, 运行时延迟到 _create_cli 再导入,
+    # 这里只确认依赖存在, 避免 import 时就加载整套渲染模块.
     try:
         import click as click_module
-        from rich.console import Console as ConsoleType
-        from rich.tree import Tree as TreeType
+        import rich  # noqa: F401
     except ImportError:
         click_module = None
-        ConsoleType = None
-        TreeType = None
 
 from tarsio._core import TraceNode, decode_raw, decode_trace, probe_struct
 
@@ -91,6 +91,10 @@ def parse_hex_string(hex_str: str) -> bytes:
     return bytes.fromhex(cleaned)
 
 
+# hex 字符到半字节值的查找表, 模块加载时构建一次.
+_HEX_DIGIT_VALUES: dict[str, int] = {ch: int(ch, 16) for ch in string.hexdigits}
+
+
 def _parse_hex_stream(path: Path, chunk_size: int = 65536) -> bytes:
     """流式解析 hex 文本文件.
 
@@ -106,9 +110,8 @@ def _parse_hex_stream(path: Path, chunk_size: int = 65536) -> bytes:
         ValueError: 文件内容不是合法 hex.
         OSError: 文件读取失败.
     """
-    hex_digits = set(string.hexdigits)
     output = bytearray()
-    pending: str | None = None
+    pending: int | None = None
     saw_digit = False
     pending_prefix_zero = False
     pending_prefix_pos = -1
@@ -116,13 +119,14 @@ def _parse_hex_stream(path: Path, chunk_size: int = 65536) -> bytes:
 
     def push_hex(ch: str, pos: int) -> None:
         nonlocal pending, saw_digit
-        if ch not in hex_digits:
+        value = _HEX_DIGIT_VALUES.get(ch)
+        if value is None:
             raise ValueError(f"第 {pos} 位包含非法 hex 字符: {ch!r}")
         saw_digit = True
         if pending is None:
-            pending = ch
+            pending = value
         else:
-            output.append(int(f"{pending}{ch}", 16))
+            output.append((pending << 4) | value)
             pending = None
 
     with path.open("r", encoding="utf-8") as f:
@@ -189,13 +193,15 @@ def _read_input(
     return InputBuffer(data=view, mm=mm, view=view)
 
 
+# 输出模式到解码函数的映射, 未列出的模式(pretty/json)均走 Raw 解码.
+_PAYLOAD_DECODERS: dict[str, Callable[[bytes | memoryview], Any]] = {
+    "tree": decode_trace,
+}
+
+
 def _decode_payload(data: bytes | memoryview, fmt: str) -> Any:
     """按输出模式执行解码."""
-    if fmt == "tree":
-        if isinstance(data, memoryview):
-            return decode_trace(data.tobytes())
-        return decode_trace(data)
-    return decode_raw(data)
+    return _PAYLOAD_DECODERS.get(fmt, decode_raw)(data)
 
 
 def _allow_probe(
@@ -218,6 +224,9 @@ def _probe_bytes(
     payload: bytes, depth: int, policy: ProbePolicy, rt: ProbeRuntime
 ) -> Any | None:
     """带缓存地探测 bytes 是否可解释为 Struct."""
+    # probe=off 时不会探测任何节点, 也无需写入缓存
+    if policy.mode == "off":
+        return None
     if payload in rt.probe_cache:
         return rt.probe_cache[payload]
     if not _allow_probe(payload, depth, policy, rt):
@@ -248,11 +257,29 @@ def _decode_trace_cached(payload: bytes, rt: ProbeRuntime) -> TraceNode:
 
 
 def deep_probe(data: Any, policy: ProbePolicy, rt: ProbeRuntime, depth: int = 0) -> Any:
-    """递归探测并解码 bytes 中的 Struct."""
+    """递归探测并解码 bytes 中的 Struct, 同时将容器规整为纯 dict/list.
+
+    容器按写时复制处理: 纯 dict/list 的子节点均未变化时原样返回, 仅在首个子节点
+    被替换时复制一次; TarsDict 等子类总是复制为纯容器.
+    """
     if isinstance(data, dict):
-        return {k: deep_probe(v, policy, rt, depth + 1) for k, v in data.items()}
+        new_dict: dict[Any, Any] | None = None if type(data) is dict else dict(data)
+        for k, v in data.items():
+            probed = deep_probe(v, policy, rt, depth + 1)
+            if probed is not v:
+                if new_dict is None:
+                    new_dict = dict(data)
+                new_dict[k] = probed
+        return data if new_dict is None else new_dict
     if isinstance(data, list):
-        return [deep_probe(item, policy, rt, depth + 1) for item in data]
+        new_list: list[Any] | None = None if type(data) is list else list(data)
+        for i, item in enumerate(data):
+            probed = deep_probe(item, policy, rt, depth + 1)
+            if probed is not item:
+                if new_list is None:
+                    new_list = list(data)
+                new_list[i] = probed
+        return data if new_list is None else new_list
     if isinstance(data, bytes):
         struct = _probe_bytes(data, depth, policy, rt)
         if struct:
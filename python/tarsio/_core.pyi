@@ -471,7 +471,7 @@ def decode_raw(data: _BytesLike) -> TarsDict:
     """
     ...
 
-def probe_struct(data: bytes) -> TarsDict | None:
+def probe_struct(data: _BytesLike) -> TarsDict | None:
     """尝试将字节数据递归解析为 Tars 结构.
 
     这是一个启发式工具，用于探测一段二进制数据是否恰好是有效的 Tars 序列化结构。
@@ -508,11 +508,11 @@ class TraceNode:
 
     def to_dict(self) -> dict[str, Any]: ...
 
-def decode_trace(data: bytes, cls: type[Any] | None = None) -> TraceNode:
+def decode_trace(data: _BytesLike, cls: type[Any] | None = None) -> TraceNode:
     """解析二进制数据并生成追踪树.
 
     Args:
-        data: Tars 二进制数据.
+        data: Tars 二进制数据, 支持 bytes、bytearray 与 memoryview.
         cls: 可选的 Struct 类型，用于提供 Schema 信息.
 
     Returns:
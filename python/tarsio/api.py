@@ -48,18 +48,12 @@ def encode(obj: Any) -> bytes:
         TypeError: 如果对象既不是有效的 Struct 也不是支持的 Raw 类型。
         ValueError: 如果数据校验失败。
     """
-    # 优先处理显式的 Raw 容器和基本类型
-    if isinstance(
-        obj, (TarsDict, dict, list, tuple, set, int, float, str, bytes, bool)
-    ):
-        return _core_encode_raw(obj)
-
-    # 尝试作为 Struct 处理 (Struct)
-    # 优化：通过检查特征属性避免 try-except 开销
+    # Struct 是最常见的输入, 先交给 Rust 的 Schema 编码器.
+    # Struct 的实例布局与内置容器/基本类型互斥, 调整判断顺序不影响分派结果.
     if isinstance(obj, Struct):
         return _core_encode(obj)
 
-    # 如果不是 Struct，最后尝试 Raw 兜底
+    # 其余输入(显式的 Raw 容器、基本类型以及兜底情况)统一走 Raw 编码
     return _core_encode_raw(obj)
 
 
@@ -98,6 +92,10 @@ def decode(
         TypeError: 参数类型错误、目标类未注册 Schema、或目标类不是 Struct/TarsDict。
         ValueError: 数据格式不正确。
     """
+    # 默认参数(Raw 解码)最常见, 先做身份比较, 跳过 get_origin
+    if cls is TarsDict:
+        return _core_decode_raw(data)
+
     origin_cls = get_origin(cls) or cls
 
     if origin_cls is TarsDict:
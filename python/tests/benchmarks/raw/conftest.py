@@ -43,13 +43,13 @@ def raw_mixed_bytes(raw_mixed_data):
     return encode_raw(raw_mixed_data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def raw_huge_blob_struct() -> TarsDict:
     """生成包含 10MB Blob 的 Raw Struct (字典)."""
     return TarsDict({0: b"\x00" * (10 * 1024 * 1024)})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def raw_huge_blob_bytes(raw_huge_blob_struct):
     """生成包含 10MB Blob 的 Raw Struct 编码数据."""
     return encode_raw(raw_huge_blob_struct)
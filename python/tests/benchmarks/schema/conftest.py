@@ -129,26 +129,26 @@ def high_tag_bytes(high_tag_obj):
     return encode(high_tag_obj)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def large_data_obj():
     """生成大数据测试对象."""
     size = 10000
     return LargeData(blob=b"\x01" * size, ints=[1] * size)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def large_data_bytes(large_data_obj):
     """生成大数据编码数据."""
     return encode(large_data_obj)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def huge_blob_obj():
     """生成超大 Blob (10MB) 用于 Zero-copy 测试."""
     return LargeData(blob=b"\xff" * (10 * 1024 * 1024), ints=[])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def huge_blob_bytes(huge_blob_obj):
     """生成超大 Blob 编码数据."""
     return encode(huge_blob_obj)
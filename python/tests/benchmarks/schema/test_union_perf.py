@@ -49,11 +49,8 @@ def test_union_encoding_perf(benchmark):
     """验证 Union 类型在特定变体命中时的编码性能."""
     # 测试场景：编码最后一个变体，触发初始线性扫描但在缓存命中后降至 O(1).
     obj = Wrapper(val=U5(b=3.14))
-
-    def run_encode():
-        encode(obj)
-
-    benchmark(run_encode)
+    # 直接交给 benchmark 调用, 计时循环内不额外经过一层 Python 闭包.
+    benchmark(encode, obj)
 
 
 def test_union_encoding_mixed_perf(benchmark):
@@ -306,6 +306,33 @@ def test_cli_probe_auto_skips_when_bytes_exceed_threshold(
     assert ">>> Probed Structure >>>" not in result.output
 
 
+def test_cli_probe_off_keeps_nested_bytes_in_output_file(
+    cli_runner: CliRunner, cli, tmp_path: Path
+) -> None:
+    """CLI probe=off 时输出文件保留嵌套 bytes 原值."""
+    nested_simplelist_hex = "0800010c1d0000020001"
+    output_file = tmp_path / "out.json"
+    result = cli_runner.invoke(
+        cli,
+        [nested_simplelist_hex, "--probe", "off", "-o", str(output_file)],
+    )
+    assert result.exit_code == 0
+
+    data = json.loads(output_file.read_text())
+    assert data == {"0": {"0": "\x00\x01"}}
+
+
+def test_cli_probe_off_pretty_output_uses_plain_dicts(
+    cli_runner: CliRunner, cli
+) -> None:
+    """CLI probe=off 时 pretty 输出将嵌套 TarsDict 规整为纯 dict."""
+    nested_struct_hex = "0A0C0B"
+    result = cli_runner.invoke(cli, [nested_struct_hex, "--probe", "off"])
+    assert result.exit_code == 0
+    assert "TarsDict" not in result.output
+    assert "{0: {0: 0}}" in result.output
+
+
 # ==========================================
 # 错误处理
 # ==========================================
@@ -14,6 +14,9 @@ from tarsio._core import (
     probe_struct,
 )
 
+# {0: 1, 1: "s"}, 用于 bytes-like 输入类型的测试
+_SAMPLE_STRUCT = bytes.fromhex("0001160173")
+
 
 @pytest.mark.parametrize(
     ("val", "expected_hex"),
@@ -379,6 +382,51 @@ def test_decode_trace_depth_exceeded() -> None:
         decode_trace(data)
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        bytearray(_SAMPLE_STRUCT),
+        memoryview(_SAMPLE_STRUCT),
+        memoryview(bytearray(_SAMPLE_STRUCT)),
+    ],
+    ids=["bytearray", "memoryview", "memoryview_bytearray"],
+)
+def test_decode_trace_accepts_buffer_protocol_inputs(
+    value: bytearray | memoryview,
+) -> None:
+    """decode_trace 对 bytes-like 输入的结果应与 bytes 输入一致."""
+    expected = decode_trace(_SAMPLE_STRUCT).to_dict()
+    assert decode_trace(value).to_dict() == expected
+
+
+def test_decode_trace_rejects_str_input() -> None:
+    """decode_trace 传入 str 时应抛出 TypeError."""
+    with pytest.raises(TypeError):
+        decode_trace("0001160173")  # pyright: ignore[reportArgumentType]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        bytearray(_SAMPLE_STRUCT),
+        memoryview(_SAMPLE_STRUCT),
+        memoryview(bytearray(_SAMPLE_STRUCT)).toreadonly(),
+    ],
+    ids=["bytearray", "memoryview", "readonly_memoryview_bytearray"],
+)
+def test_decode_raw_accepts_buffer_protocol_inputs(
+    value: bytearray | memoryview,
+) -> None:
+    """decode_raw 对 bytes-like 输入的结果应与 bytes 输入一致."""
+    assert decode_raw(value) == decode_raw(_SAMPLE_STRUCT)
+
+
+def test_decode_raw_rejects_str_input() -> None:
+    """decode_raw 传入 str 时应抛出 TypeError."""
+    with pytest.raises(TypeError):
+        decode_raw("0001160173")  # pyright: ignore[reportArgumentType]
+
+
 def test_probe_struct_valid() -> None:
     """测试 probe_struct 有效性."""
     # {0: 1, 1: "s"} -> 00 01 16 01 73
@@ -391,6 +439,36 @@ def test_probe_struct_valid() -> None:
     assert probe_struct(bytes.fromhex("0A11")) is None
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        bytearray(_SAMPLE_STRUCT),
+        memoryview(_SAMPLE_STRUCT),
+        memoryview(_SAMPLE_STRUCT)[0:],
+        memoryview(bytearray(_SAMPLE_STRUCT)),
+        memoryview(bytearray(_SAMPLE_STRUCT)).toreadonly(),
+    ],
+    ids=[
+        "bytearray",
+        "memoryview",
+        "memoryview_slice",
+        "memoryview_bytearray",
+        "readonly_memoryview_bytearray",
+    ],
+)
+def test_probe_struct_accepts_buffer_protocol_inputs(
+    value: bytearray | memoryview,
+) -> None:
+    """probe_struct 对 bytes-like 输入的结果应与 bytes 输入一致."""
+    assert probe_struct(value) == {0: 1, 1: "s"}
+
+
+def test_probe_struct_rejects_str_input() -> None:
+    """probe_struct 传入 str 时应抛出 TypeError."""
+    with pytest.raises(TypeError):
+        probe_struct("0001160173")  # pyright: ignore[reportArgumentType]
+
+
 def test_decode_schema_accepts_buffer_protocol_input() -> None:
     """Schema decode 应接受 bytearray 和 memoryview 输入."""
     from tarsio import Struct
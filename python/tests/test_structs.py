@@ -3,6 +3,7 @@
 验证 Struct 构造、配置、默认值、演进兼容性等 API 契约.
 """
 
+import array
 from typing import Annotated, Any, Generic, Optional, TypeVar
 
 import pytest
@@ -170,6 +171,35 @@ def test_init_numeric_constraints_raises_validation_error() -> None:
         Demo(a=0)
 
 
+def test_decode_numeric_gt_constraint_raises_validation_error() -> None:
+    """解码期 gt 约束不满足应抛出 ValidationError."""
+
+    class Demo(Struct):
+        a: Annotated[int, Meta(gt=0, le=10)]
+
+    with pytest.raises(ValidationError, match="must be >"):
+        decode(Demo, encode_raw(TarsDict({0: 0})))
+
+
+def test_decode_numeric_le_constraint_raises_validation_error() -> None:
+    """解码期 le 约束不满足应抛出 ValidationError."""
+
+    class Demo(Struct):
+        a: Annotated[int, Meta(gt=0, le=10)]
+
+    with pytest.raises(ValidationError, match="must be <="):
+        decode(Demo, encode_raw(TarsDict({0: 11})))
+
+
+def test_decode_numeric_constraints_boundary_passes() -> None:
+    """解码期数值落在约束边界上时应正常解码."""
+
+    class Demo(Struct):
+        a: Annotated[int, Meta(gt=0, le=10)]
+
+    assert decode(Demo, encode_raw(TarsDict({0: 10}))).a == 10
+
+
 def test_init_length_constraints_raises_validation_error() -> None:
     """构造期长度约束不满足应抛出 ValidationError."""
 
@@ -461,6 +491,28 @@ def test_public_decode_rejects_non_struct_target_type() -> None:
         public_decode(b"", int)
 
 
+def test_struct_decode_accepts_readonly_view_over_bytearray() -> None:
+    """Struct.decode 应接受 bytearray 之上的只读 memoryview."""
+
+    class Box(Struct):
+        uid: Annotated[int, 0]
+
+    data = bytearray(encode_raw(TarsDict({0: 7})))
+    restored = Box.decode(memoryview(data).toreadonly())
+
+    assert restored.uid == 7
+
+
+def test_struct_decode_rejects_str_input() -> None:
+    """Struct.decode 传入 str 时应抛出 TypeError."""
+
+    class Box(Struct):
+        uid: Annotated[int, 0]
+
+    with pytest.raises(TypeError):
+        Box.decode("0007")  # pyright: ignore[reportArgumentType]
+
+
 # ==========================================
 # 递归结构体测试
 # ==========================================
@@ -1015,6 +1067,29 @@ def test_bytes_field_accepts_non_contiguous_memoryview() -> None:
     assert isinstance(restored.v, bytes)
 
 
+_BUFFER_PAYLOAD = bytes(range(256)) * 4
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        bytearray(_BUFFER_PAYLOAD),
+        memoryview(_BUFFER_PAYLOAD),
+        memoryview(bytearray(_BUFFER_PAYLOAD))[10:-10],
+        array.array("H", [1, 2, 0xFFFF]),
+        bytearray(),
+    ],
+    ids=["bytearray", "memoryview", "memoryview_slice", "array_u16", "empty"],
+)
+def test_bytes_field_encodes_buffer_inputs_identically_to_bytes(value: Any) -> None:
+    """bytes-like 值的编码结果应与 bytes(value) 一致."""
+
+    class B(Struct):
+        v: Annotated[bytes, 0]
+
+    assert encode(B(value)) == encode(B(bytes(value)))
+
+
 def test_any_simplelist_auto_utf8_and_passthrough() -> None:
     """Any 字段在遇到 SimpleList 时应保留为 bytes (不再自动转 str)."""
 
@@ -85,6 +85,21 @@ def test_list_roundtrip() -> None:
     assert decoded.l2 == ["a", "b"]
 
 
+def test_primitive_list_roundtrip() -> None:
+    """验证 list/tuple 中各基本类型元素的编解码."""
+
+    class PrimitiveLists(Struct):
+        floats: Annotated[list[float], 0]
+        strs: Annotated[tuple[str, ...], 1]
+        bools: Annotated[list[bool], 2]
+
+    obj = PrimitiveLists([0.0, 1.5, -2.25], ("", "a", "中文"), [True, False])
+    decoded = decode(PrimitiveLists, encode(obj))
+    assert decoded.floats == [0.0, 1.5, -2.25]
+    assert decoded.strs == ("", "a", "中文")
+    assert decoded.bools == [True, False]
+
+
 def test_tuple_fixed_roundtrip() -> None:
     """验证定长 tuple[T1, T2] 的编解码."""
 
@@ -1,27 +1,28 @@
 use crate::binding::codec::raw::{
-    decode_any_struct_fields, decode_any_value, decode_raw_from_bytes, read_size_non_negative,
+    decode_any_struct_fields, decode_any_value, decode_raw_from_bytes, decode_utf8_str,
+    read_size_non_negative,
 };
 use crate::binding::error::{DeError, DeResult, PathItem};
 use crate::binding::instantiate::run_post_init;
 use crate::binding::ir::{Constraints, StructDef, TypeExpr, WireType};
 use crate::binding::schema::{TarsDict, ensure_schema_for_class};
-use crate::binding::utils::{check_depth, class_from_type, try_coerce_buffer_to_bytes};
+use crate::binding::utils::{MAX_DEPTH, check_depth, class_from_type, with_input_bytes};
 use crate::binding::validation::{
     validate_constraints_on_value, validate_length_constraints_raw,
-    validate_numeric_constraints_raw,
+    validate_non_numeric_constraints_on_value, validate_numeric_constraints_raw,
 };
 use crate::codec::consts::TarsType;
 use crate::codec::reader::TarsReader;
 use pyo3::ffi;
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyBytes, PyDict, PySet, PyTuple, PyType};
-use simdutf8::basic::from_utf8;
+use smallvec::{SmallVec, smallvec};
 
 /// 将 Tars 二进制数据解码为 Struct 实例(Schema API).
 ///
 /// Args:
 ///     cls: 目标 Struct 类型.
-///     data: 待解码的 bytes.
+///     data: 待解码的 bytes-like 对象, bytes 及基于 bytes 的 memoryview 直接借用, 其余先拷贝.
 ///
 /// Returns:
 ///     解码得到的实例.
@@ -35,10 +36,9 @@ pub fn decode<'py>(
     cls: &Bound<'py, PyType>,
     data: &Bound<'py, PyAny>,
 ) -> PyResult<Bound<'py, PyAny>> {
-    let bytes = try_coerce_buffer_to_bytes(data)?.ok_or_else(|| {
+    with_input_bytes(data, |bytes| decode_object(py, cls, bytes))?.ok_or_else(|| {
         pyo3::exceptions::PyTypeError::new_err("argument 'data': expected a bytes-like object")
-    })?;
-    decode_object(py, cls, bytes.as_bytes())
+    })?
 }
 
 /// 内部:将字节解码为 Tars Struct 实例.
@@ -94,13 +94,11 @@ fn deserialize_struct<'py>(
         Bound::from_owned_ptr(py, obj_ptr)
     };
 
-    // 使用位掩码追踪已见字段 (支持高达 64 个字段)
-    let mut seen_mask: u64 = 0;
-    let mut seen_vec: Option<Vec<bool>> = if field_count > 64 {
-        Some(vec![false; field_count])
-    } else {
-        None
-    };
+    // 使用按 64 位分块的位图追踪已见字段; Tag 上限为 255, 因此位图始终内联在栈上
+    let mut seen: SmallVec<[u64; 4]> = smallvec![0; field_count.div_ceil(64)];
+
+    // 叶子字段的值位于 depth + 1, 预先判定一次即可走直读快路径
+    let leaf_depth_ok = depth + 1 < MAX_DEPTH;
 
     // 读取字段,直到遇到 StructEnd 或 EOF
     while !reader.is_end() {
@@ -113,13 +111,7 @@ fn deserialize_struct<'py>(
             break;
         }
 
-        let idx_opt = if (tag as usize) < def.tag_lookup_vec.len() {
-            def.tag_lookup_vec[tag as usize]
-        } else {
-            None
-        };
-
-        if let Some(idx) = idx_opt {
+        if let Some(idx) = def.field_index(tag) {
             let field = &def.fields_sorted[idx];
             let value_result: DeResult<Bound<'py, PyAny>> = if field.wrap_simplelist {
                 if type_id != TarsType::SimpleList {
@@ -172,10 +164,8 @@ fn deserialize_struct<'py>(
                                         "Trailing bytes after SimpleList TarsDict decode".into(),
                                     ));
                                 }
-                                let tarsdict_type = py.get_type::<TarsDict>();
-                                let instance =
-                                    tarsdict_type.call1((dict,)).map_err(DeError::wrap)?;
-                                Ok(instance.into_any())
+                                // decode_struct_fields 已直接产出 TarsDict 实例
+                                Ok(dict.into_any())
                             }
                             _ => Err(DeError::new(format!(
                                 "Field '{}' with wrap_simplelist=True must be Struct or TarsDict",
@@ -184,6 +174,11 @@ fn deserialize_struct<'py>(
                         }
                     }
                 }
+            } else if let TypeExpr::Primitive(wire_type) = &field.ty
+                && leaf_depth_ok
+            {
+                // 基本类型字段直接读取, 跳过 deserialize_value 的通用分发
+                deserialize_primitive(py, reader, type_id, wire_type, field.constraints.as_deref())
             } else {
                 deserialize_value(
                     py,
@@ -197,8 +192,19 @@ fn deserialize_struct<'py>(
             let value = value_result.map_err(|e| e.prepend(PathItem::Field(field.name.clone())))?;
 
             if let Some(c) = field.constraints.as_deref() {
-                validate_constraints_on_value(&value, c, Some(field.name.as_str()))
-                    .map_err(DeError::wrap)
+                // 数值类基本类型已在 deserialize_primitive 中按原生值校验过范围约束
+                let numeric_checked = matches!(
+                    field.ty,
+                    TypeExpr::Primitive(
+                        WireType::Int | WireType::Long | WireType::Float | WireType::Double
+                    )
+                );
+                let res = if numeric_checked {
+                    validate_non_numeric_constraints_on_value(&value, c, Some(field.name.as_str()))
+                } else {
+                    validate_constraints_on_value(&value, c, Some(field.name.as_str()))
+                };
+                res.map_err(DeError::wrap)
                     .map_err(|e| e.prepend(PathItem::Field(field.name.clone())))?;
             }
 
@@ -219,11 +225,7 @@ fn deserialize_struct<'py>(
                 }
             }
 
-            if let Some(vec) = seen_vec.as_mut() {
-                vec[idx] = true;
-            } else {
-                seen_mask |= 1 << idx;
-            }
+            seen[idx >> 6] |= 1 << (idx & 63);
         } else {
             if def.forbid_unknown_tags {
                 return Err(DeError::new(format!(
@@ -237,43 +239,41 @@ fn deserialize_struct<'py>(
         }
     }
 
-    // 处理未出现的字段 (默认值/必填检查)
-    for (idx, field) in def.fields_sorted.iter().enumerate() {
-        let is_seen = if let Some(vec) = &seen_vec {
-            vec[idx]
-        } else {
-            (seen_mask & (1 << idx)) != 0
-        };
-
-        if !is_seen {
-            let value_opt = if let Some(default_value) = field.default_value.as_ref() {
-                Some(default_value.bind(py).clone())
-            } else if let Some(factory) = field.default_factory.as_ref() {
-                Some(factory.bind(py).call0().map_err(DeError::wrap)?)
-            } else if field.is_optional {
-                Some(py.None().into_bound(py))
-            } else if field.is_required {
-                return Err(DeError::new(format!(
-                    "Missing required field '{}' in deserialization",
-                    field.name
-                )));
-            } else {
-                None
-            };
-
-            if let Some(val) = value_opt {
-                // SAFETY:
-                // 1. 与上方字段写入相同，目标对象与属性名/属性值均有效。
-                // 2. C API 失败时异常由 Python 设置，立即抓取返回。
-                unsafe {
-                    let name_py = field.name_py.bind(py);
-                    let res = ffi::PyObject_GenericSetAttr(
-                        instance.as_ptr(),
-                        name_py.as_ptr(),
-                        val.as_ptr(),
-                    );
-                    if res != 0 {
-                        return Err(DeError::wrap(PyErr::fetch(py)));
+    // 处理未出现的字段 (默认值/必填检查).
+    // 载荷通常包含全部字段, 位图计数相符时整段跳过, 不再逐字段测试位.
+    let seen_count: usize = seen.iter().map(|w| w.count_ones() as usize).sum();
+    if seen_count < field_count {
+        for (idx, field) in def.fields_sorted.iter().enumerate() {
+            if seen[idx >> 6] & (1 << (idx & 63)) == 0 {
+                let value_opt = if let Some(default_value) = field.default_value.as_ref() {
+                    Some(default_value.bind(py).clone())
+                } else if let Some(factory) = field.default_factory.as_ref() {
+                    Some(factory.bind(py).call0().map_err(DeError::wrap)?)
+                } else if field.is_optional {
+                    Some(py.None().into_bound(py))
+                } else if field.is_required {
+                    return Err(DeError::new(format!(
+                        "Missing required field '{}' in deserialization",
+                        field.name
+                    )));
+                } else {
+                    None
+                };
+
+                if let Some(val) = value_opt {
+                    // SAFETY:
+                    // 1. 与上方字段写入相同，目标对象与属性名/属性值均有效。
+                    // 2. C API 失败时异常由 Python 设置，立即抓取返回。
+                    unsafe {
+                        let name_py = field.name_py.bind(py);
+                        let res = ffi::PyObject_GenericSetAttr(
+                            instance.as_ptr(),
+                            name_py.as_ptr(),
+                            val.as_ptr(),
+                        );
+                        if res != 0 {
+                            return Err(DeError::wrap(PyErr::fetch(py)));
+                        }
                     }
                 }
             }
@@ -473,10 +473,7 @@ fn deserialize_primitive<'py>(
                 validate_length_constraints_raw(bytes.len(), c, None).map_err(DeError::wrap)?;
             }
 
-            let s = from_utf8(bytes).map_err(|_| DeError::new("Invalid UTF-8 string".into()))?;
-            Ok(s.into_pyobject(py)
-                .map_err(|e| DeError::new(e.to_string()))?
-                .into_any())
+            decode_utf8_str(py, bytes)
         }
         _ => Err(DeError::new("Unexpected wire type for primitive".into())),
     }
@@ -553,9 +550,7 @@ fn deserialize_tarsdict_value<'py>(
         ));
     }
     let dict = decode_any_struct_fields(py, reader, depth + 1)?;
-    let tarsdict_type = py.get_type::<TarsDict>();
-    let instance = tarsdict_type.call1((dict,)).map_err(DeError::wrap)?;
-    Ok(instance.into_any())
+    Ok(dict.into_any())
 }
 
 fn deserialize_bytes_value<'py>(
@@ -629,20 +624,32 @@ fn deserialize_list_value<'py>(
         }
         Bound::from_owned_ptr(py, ptr)
     };
+    // 基本类型元素(含整数): wire type 在循环外确定, 深度检查也只做一次(空列表不检查),
+    // 循环内直接进入 deserialize_primitive, 不再经过 deserialize_value 的分发.
+    let primitive = match inner {
+        TypeExpr::Primitive(wire_type) => {
+            if len > 0 {
+                check_depth(depth + 1).map_err(DeError::wrap)?;
+            }
+            Some(wire_type)
+        }
+        _ => None,
+    };
+    let list_ptr = list_any.as_ptr();
     for idx in 0..len {
         let (_, item_type) = reader
             .read_head()
             .map_err(|e| DeError::new(format!("Failed to read list item head: {}", e)))?;
-        let item = deserialize_value(py, reader, item_type, inner, None, depth + 1)
-            .map_err(|e| e.prepend(PathItem::Index(idx)))?;
-        let set_res = unsafe {
-            // SAFETY: PyList_SetItem 会“偷”引用, item.into_ptr 转移所有权。
-            // 每个索引只写入一次,与 PyList_New 的预分配长度一致。
-            ffi::PyList_SetItem(list_any.as_ptr(), idx as isize, item.into_ptr())
-        };
-        if set_res != 0 {
-            return Err(DeError::wrap(PyErr::fetch(py)));
+        let item = match primitive {
+            Some(wire_type) => deserialize_primitive(py, reader, item_type, wire_type, None),
+            None => deserialize_value(py, reader, item_type, inner, None, depth + 1),
         }
+        .map_err(|e| e.prepend(PathItem::Index(idx)))?;
+        // SAFETY:
+        // 1. `list_ptr` 指向上方以 `PyList_New(len)` 新建、尚未暴露给 Python 的列表.
+        // 2. `idx < len`, 且每个槽位只写入一次, 原槽位为 NULL, 无需释放旧值.
+        // 3. `PyList_SET_ITEM` 偷取引用, `into_ptr` 转移所有权.
+        unsafe { ffi::PyList_SET_ITEM(list_ptr, idx as ffi::Py_ssize_t, item.into_ptr()) };
     }
     Ok(list_any)
 }
@@ -1,9 +1,11 @@
 use bytes::BufMut;
-use pyo3::exceptions::{PyRuntimeError, PyTypeError, PyValueError};
+use pyo3::exceptions::{PyRuntimeError, PyTypeError, PyUnicodeDecodeError, PyValueError};
 use pyo3::ffi;
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{
-    PyAny, PyBool, PyBytes, PyDict, PyFloat, PyFrozenSet, PyList, PySequence, PySet, PyString,
+    PyAny, PyBool, PyBytes, PyDict, PyFloat, PyFrozenSet, PyInt, PyList, PySequence, PySet,
+    PyString, PyTuple,
 };
 use simdutf8::basic::from_utf8;
 use std::cell::RefCell;
@@ -13,10 +15,10 @@ use smallvec::SmallVec;
 use crate::binding::codec::ser;
 use crate::binding::error::{DeError, DeResult, PathItem};
 use crate::binding::ir::{StructDef, TypeExpr};
-use crate::binding::schema::{TarsDict, ensure_schema_for_class};
+use crate::binding::schema::{Struct, TarsDict, ensure_schema_for_class};
 use crate::binding::utils::{
-    PySequenceFast, check_depth, check_exact_sequence_type, dataclass_fields, maybe_shrink_buffer,
-    try_coerce_buffer_to_bytes, with_stdlib_cache,
+    MAX_DEPTH, PySequenceFast, check_depth, check_exact_sequence_type, dataclass_fields,
+    maybe_shrink_buffer, with_buffer_bytes, with_input_bytes, with_stdlib_cache,
 };
 use crate::codec::consts::TarsType;
 use crate::codec::reader::TarsReader;
@@ -40,8 +42,14 @@ where
 {
     check_depth(depth)?;
 
+    // 循环不变量提到外层, 字段循环内只剩属性读取与分派.
+    let py = obj.py();
+    let omit_defaults = def.omit_defaults;
+    let child_depth = depth + 1;
+
     for field in &def.fields_sorted {
-        let value = obj.getattr(field.name_py.bind(obj.py())).ok();
+        // 未赋值的槽位按缺失处理; getattr_opt 在解释器支持时不会为此构造 AttributeError
+        let value = obj.getattr_opt(field.name_py.bind(py)).ok().flatten();
 
         match value {
             Some(val) => {
@@ -49,34 +57,35 @@ where
                     // 可选字段为 None 时跳过
                     continue;
                 }
-                if def.omit_defaults {
-                    if let Some(default_val) = &field.default_value {
-                        if val.eq(default_val.bind(obj.py()))? {
-                            continue;
-                        }
-                    } else if field.is_optional && val.is_none() {
-                        continue;
-                    }
+                if omit_defaults && field.equals_default(&val)? {
+                    continue;
                 }
                 if enable_wrap_simplelist && field.wrap_simplelist {
-                    let payload = match &field.ty {
+                    match &field.ty {
                         TypeExpr::Struct(cls_obj) => {
-                            let cls = crate::binding::utils::class_from_type(obj.py(), cls_obj);
-                            let nested_def = ensure_schema_for_class(obj.py(), &cls)?;
-                            ser::encode_struct_payload_to_vec(&val, &nested_def, depth + 1)?
+                            let cls = crate::binding::utils::class_from_type(py, cls_obj);
+                            let nested_def = ensure_schema_for_class(py, &cls)?;
+                            ser::write_struct_payload(
+                                writer,
+                                field.tag,
+                                &val,
+                                &nested_def,
+                                child_depth,
+                            )?;
+                        }
+                        TypeExpr::TarsDict => {
+                            ser::write_tarsdict_payload(writer, field.tag, &val, child_depth)?;
                         }
-                        TypeExpr::TarsDict => ser::encode_tarsdict_payload_to_vec(&val, depth + 1)?,
                         _ => {
                             return Err(PyTypeError::new_err(format!(
                                 "Field '{}' with wrap_simplelist=True must be Struct or TarsDict",
                                 field.name
                             )));
                         }
-                    };
-                    writer.write_bytes(field.tag, &payload);
+                    }
                     continue;
                 }
-                serialize_typed(writer, field.tag, &field.ty, &val, depth + 1)?;
+                serialize_typed(writer, field.tag, &field.ty, &val, child_depth)?;
             }
             None => {
                 if field.is_required {
@@ -91,6 +100,30 @@ where
     Ok(())
 }
 
+/// 校验 TarsDict 的键并按 Tag 升序收集非 None 字段.
+///
+/// 常规 int 键互不相等, Tag 不会重复, 因此使用无需额外缓冲的不稳定排序;
+/// 解码得到的字典本就按 Tag 升序, 先检查有序性即可跳过排序.
+fn collect_sorted_tag_items<'py>(
+    dict: &Bound<'py, PyDict>,
+) -> PyResult<SmallVec<[(u8, Bound<'py, PyAny>); 16]>> {
+    let mut items: SmallVec<[(u8, Bound<'py, PyAny>); 16]> = SmallVec::with_capacity(dict.len());
+    for (key, value) in dict.iter() {
+        if value.is_none() {
+            continue;
+        }
+        let tag = key
+            .extract::<u8>()
+            .map_err(|_| PyTypeError::new_err("Struct tag must be int in range 0-255"))?;
+        items.push((tag, value));
+    }
+
+    if !items.is_sorted_by_key(|(tag, _)| *tag) {
+        items.sort_unstable_by_key(|(tag, _)| *tag);
+    }
+    Ok(items)
+}
+
 pub(crate) fn write_tarsdict_fields<W, F>(
     writer: &mut TarsWriter<W>,
     dict: &Bound<'_, PyDict>,
@@ -103,19 +136,7 @@ where
 {
     check_depth(depth)?;
 
-    let mut items: SmallVec<[(u8, Bound<'_, PyAny>); 16]> = SmallVec::with_capacity(dict.len());
-    for (key, value) in dict.iter() {
-        if value.is_none() {
-            continue;
-        }
-        let tag = key
-            .extract::<u8>()
-            .map_err(|_| PyTypeError::new_err("Struct tag must be int in range 0-255"))?;
-        items.push((tag, value));
-    }
-
-    items.sort_by_key(|(tag, _)| *tag);
-    for (tag, value) in items {
+    for (tag, value) in collect_sorted_tag_items(dict)? {
         serialize_any(writer, tag, &value, depth + 1, serialize_typed)?;
     }
     Ok(())
@@ -136,11 +157,49 @@ where
     if value.is_none() {
         return Err(PyTypeError::new_err("Unsupported class type: NoneType"));
     }
-    if value.is_instance_of::<PyBool>() {
-        let v: bool = value.extract()?;
-        writer.write_int(tag, i64::from(v));
+
+    // 精确类型快速分发: 常见内置类型只需一次类型指针比较,
+    // 避免逐级 isinstance 以及对 dict/list 做 Schema 探测. 子类仍走下方的完整判定.
+    if value.is_exact_instance_of::<PyInt>()
+        && let Ok(v) = value.extract::<i64>()
+    {
+        writer.write_int(tag, v);
+        return Ok(());
+    }
+    if value.is_exact_instance_of::<PyString>() {
+        let v = value.cast::<PyString>()?.to_str()?;
+        writer.write_string(tag, v);
+        return Ok(());
+    }
+    if value.is_exact_instance_of::<PyDict>() {
+        return serialize_any_dict(writer, tag, value.cast::<PyDict>()?, depth, serialize_typed);
+    }
+    if value.is_exact_instance_of::<PyList>() || value.is_exact_instance_of::<PyTuple>() {
+        return serialize_any_sequence(writer, tag, value, depth, serialize_typed);
+    }
+    // bool 不可被继承, 一次 cast 同时完成类型判断与取值, 无需再经 extract 复查类型
+    if let Ok(v) = value.cast::<PyBool>() {
+        writer.write_int(tag, i64::from(v.is_true()));
         return Ok(());
     }
+    if let Ok(v) = value.cast_exact::<PyFloat>() {
+        writer.write_double(tag, v.value());
+        return Ok(());
+    }
+    if let Ok(v) = value.cast_exact::<PyBytes>() {
+        writer.write_bytes(tag, v.as_bytes());
+        return Ok(());
+    }
+    // TarsDict 已是按 tag 组织的结构体载荷 (常见于 decode_raw 结果的回写),
+    // 在一次类型检查后直接编码, 不再依次经过 float/buffer/整数提取与 Enum 判定.
+    if value.is_instance_of::<TarsDict>() {
+        let dict = value.cast::<PyDict>()?;
+        writer.write_tag(tag, TarsType::StructBegin);
+        write_tarsdict_fields(writer, dict, depth + 1, serialize_typed)?;
+        writer.write_tag(0, TarsType::StructEnd);
+        return Ok(());
+    }
+
     if value.is_instance_of::<PyFloat>() {
         let v: f64 = value.extract()?;
         writer.write_double(tag, v);
@@ -151,8 +210,7 @@ where
         writer.write_string(tag, v);
         return Ok(());
     }
-    if let Some(bytes) = try_coerce_buffer_to_bytes(value)? {
-        writer.write_bytes(tag, bytes.as_bytes());
+    if with_buffer_bytes(value, |bytes| writer.write_bytes(tag, bytes))?.is_some() {
         return Ok(());
     }
     if let Ok(v) = value.extract::<i64>() {
@@ -163,7 +221,7 @@ where
     let is_enum = with_stdlib_cache(value.py(), |cache| {
         let py = value.py();
         if value.is_instance(cache.enum_type.bind(py).as_any())? {
-            let inner = value.getattr("value")?;
+            let inner = value.getattr(intern!(py, "value"))?;
             serialize_any(writer, tag, &inner, depth + 1, serialize_typed)?;
             return Ok(true);
         }
@@ -174,16 +232,11 @@ where
         return Ok(());
     }
 
-    if value.is_instance_of::<TarsDict>() {
-        let dict = value.cast::<PyDict>()?;
-        writer.write_tag(tag, TarsType::StructBegin);
-        write_tarsdict_fields(writer, dict, depth + 1, serialize_typed)?;
-        writer.write_tag(0, TarsType::StructEnd);
-        return Ok(());
-    }
-
-    let cls = value.get_type();
-    if let Ok(def) = ensure_schema_for_class(value.py(), &cls) {
+    // 只有 Struct 子类才可能有 Schema; 先做一次 C 层类型检查, 避免 dataclass、set、
+    // 自定义序列等值每次都走 Schema 探测(getattr 失败、类型判定与错误对象构造).
+    if value.is_instance_of::<Struct>()
+        && let Ok(def) = ensure_schema_for_class(value.py(), &value.get_type())
+    {
         writer.write_tag(tag, TarsType::StructBegin);
         serialize_struct_fields(writer, value, &def, depth + 1, false, serialize_typed)?;
         writer.write_tag(0, TarsType::StructEnd);
@@ -203,14 +256,7 @@ where
     }
 
     if value.is_instance_of::<PyDict>() {
-        let dict = value.cast::<PyDict>()?;
-        writer.write_tag(tag, TarsType::Map);
-        writer.write_int(0, dict.len() as i64);
-        for (k, v) in dict {
-            serialize_any(writer, 0, &k, depth + 1, serialize_typed)?;
-            serialize_any(writer, 1, &v, depth + 1, serialize_typed)?;
-        }
-        return Ok(());
+        return serialize_any_dict(writer, tag, value.cast::<PyDict>()?, depth, serialize_typed);
     }
 
     if value.is_instance_of::<PySet>() {
@@ -235,30 +281,64 @@ where
     }
 
     if value.is_instance_of::<PyList>() || value.is_instance_of::<PySequence>() {
-        writer.write_tag(tag, TarsType::List);
-        if let Some(is_list) = check_exact_sequence_type(value) {
-            let seq_fast = PySequenceFast::new_exact(value, is_list)?;
-            let len = seq_fast.len();
-            writer.write_int(0, len as i64);
-            for i in 0..len {
-                let item = seq_fast.get_item(value.py(), i)?;
-                serialize_any(writer, 0, &item, depth + 1, serialize_typed)?;
-            }
-        } else {
-            let seq = value.extract::<Bound<'_, PySequence>>()?;
-            let len = seq.len()?;
-            writer.write_int(0, len as i64);
-            for i in 0..len {
-                let item = seq.get_item(i)?;
-                serialize_any(writer, 0, &item, depth + 1, serialize_typed)?;
-            }
-        }
-        return Ok(());
+        return serialize_any_sequence(writer, tag, value, depth, serialize_typed);
     }
 
     Err(PyTypeError::new_err("Unsupported Any value type"))
 }
 
+fn serialize_any_dict<W, F>(
+    writer: &mut TarsWriter<W>,
+    tag: u8,
+    dict: &Bound<'_, PyDict>,
+    depth: usize,
+    serialize_typed: &F,
+) -> PyResult<()>
+where
+    W: BufMut,
+    F: Fn(&mut TarsWriter<W>, u8, &TypeExpr, &Bound<'_, PyAny>, usize) -> PyResult<()>,
+{
+    writer.write_tag(tag, TarsType::Map);
+    writer.write_int(0, dict.len() as i64);
+    for (k, v) in dict {
+        serialize_any(writer, 0, &k, depth + 1, serialize_typed)?;
+        serialize_any(writer, 1, &v, depth + 1, serialize_typed)?;
+    }
+    Ok(())
+}
+
+fn serialize_any_sequence<W, F>(
+    writer: &mut TarsWriter<W>,
+    tag: u8,
+    value: &Bound<'_, PyAny>,
+    depth: usize,
+    serialize_typed: &F,
+) -> PyResult<()>
+where
+    W: BufMut,
+    F: Fn(&mut TarsWriter<W>, u8, &TypeExpr, &Bound<'_, PyAny>, usize) -> PyResult<()>,
+{
+    writer.write_tag(tag, TarsType::List);
+    if let Some(is_list) = check_exact_sequence_type(value) {
+        let seq_fast = PySequenceFast::new_exact(value, is_list)?;
+        let len = seq_fast.len();
+        writer.write_int(0, len as i64);
+        for i in 0..len {
+            let item = seq_fast.get_item(value.py(), i)?;
+            serialize_any(writer, 0, &item, depth + 1, serialize_typed)?;
+        }
+    } else {
+        let seq = value.extract::<Bound<'_, PySequence>>()?;
+        let len = seq.len()?;
+        writer.write_int(0, len as i64);
+        for i in 0..len {
+            let item = seq.get_item(i)?;
+            serialize_any(writer, 0, &item, depth + 1, serialize_typed)?;
+        }
+    }
+    Ok(())
+}
+
 #[inline]
 pub(crate) fn read_size_non_negative(reader: &mut TarsReader, context: &str) -> DeResult<usize> {
     let len = reader
@@ -279,6 +359,43 @@ pub(crate) fn read_size_non_negative(reader: &mut TarsReader, context: &str) ->
     Ok(len)
 }
 
+/// 短字符串阈值: 不超过该长度时跳过 simdutf8 预校验.
+const SHORT_STR_THRESHOLD: usize = 64;
+
+/// 将 Tars 字符串 payload 构造为 Python `str`.
+///
+/// CPython 的 UTF-8 解码器自身会做严格校验, 对短字符串(如 Map key)
+/// 额外的 simdutf8 预校验反而是主要开销, 因此短字符串直接交给 CPython 解码.
+#[inline]
+pub(crate) fn decode_utf8_str<'py>(py: Python<'py>, bytes: &[u8]) -> DeResult<Bound<'py, PyAny>> {
+    if bytes.len() <= SHORT_STR_THRESHOLD {
+        // SAFETY:
+        // 1. 指针与长度来自有效切片, errors 传空指针表示 strict 模式.
+        // 2. 返回新引用; 为空时 Python 异常已设置, 由 PyErr::fetch 取出.
+        let obj = unsafe {
+            let ptr = ffi::PyUnicode_DecodeUTF8(
+                bytes.as_ptr().cast(),
+                bytes.len() as ffi::Py_ssize_t,
+                std::ptr::null(),
+            );
+            if ptr.is_null() {
+                let err = PyErr::fetch(py);
+                if err.is_instance_of::<PyUnicodeDecodeError>(py) {
+                    return Err(DeError::new("Invalid UTF-8 string".into()));
+                }
+                return Err(DeError::wrap(err));
+            }
+            Bound::from_owned_ptr(py, ptr)
+        };
+        return Ok(obj);
+    }
+
+    let s = from_utf8(bytes).map_err(|_| DeError::new("Invalid UTF-8 string".into()))?;
+    Ok(s.into_pyobject(py)
+        .map_err(|e| DeError::new(e.to_string()))?
+        .into_any())
+}
+
 fn read_simple_list_bytes<'a>(reader: &'a mut TarsReader) -> DeResult<&'a [u8]> {
     let subtype = reader
         .read_u8()
@@ -293,6 +410,21 @@ fn read_simple_list_bytes<'a>(reader: &'a mut TarsReader) -> DeResult<&'a [u8]>
     Ok(bytes)
 }
 
+/// 读取整数叶子值; `decode_any_value` 与列表的整数快速路径共用.
+#[inline]
+fn decode_any_int<'py>(
+    py: Python<'py>,
+    reader: &mut TarsReader,
+    type_id: TarsType,
+) -> DeResult<Bound<'py, PyAny>> {
+    let v = reader
+        .read_int(type_id)
+        .map_err(|e| DeError::new(format!("Failed to read int: {e}")))?;
+    Ok(v.into_pyobject(py)
+        .map_err(|e| DeError::new(e.to_string()))?
+        .into_any())
+}
+
 pub(crate) fn decode_any_value<'py>(
     py: Python<'py>,
     reader: &mut TarsReader,
@@ -302,12 +434,7 @@ pub(crate) fn decode_any_value<'py>(
     check_depth(depth).map_err(DeError::wrap)?;
     match type_id {
         TarsType::ZeroTag | TarsType::Int1 | TarsType::Int2 | TarsType::Int4 | TarsType::Int8 => {
-            let v = reader
-                .read_int(type_id)
-                .map_err(|e| DeError::new(format!("Failed to read int: {e}")))?;
-            Ok(v.into_pyobject(py)
-                .map_err(|e| DeError::new(e.to_string()))?
-                .into_any())
+            decode_any_int(py, reader, type_id)
         }
         TarsType::Float => {
             let v = reader
@@ -329,10 +456,7 @@ pub(crate) fn decode_any_value<'py>(
             let bytes = reader
                 .read_string(type_id)
                 .map_err(|e| DeError::new(format!("Failed to read string bytes: {e}")))?;
-            let s = from_utf8(bytes).map_err(|_| DeError::new("Invalid UTF-8 string".into()))?;
-            Ok(s.into_pyobject(py)
-                .map_err(|e| DeError::new(e.to_string()))?
-                .into_any())
+            decode_utf8_str(py, bytes)
         }
         TarsType::StructBegin => {
             let dict = decode_struct_fields(py, reader, true, depth + 1).map_err(DeError::wrap)?;
@@ -351,7 +475,12 @@ pub(crate) fn decode_any_struct_fields<'py>(
     depth: usize,
 ) -> DeResult<Bound<'py, PyDict>> {
     check_depth(depth).map_err(DeError::wrap)?;
-    let dict = PyDict::new(py);
+    // 直接构造 TarsDict, 调用方无需再以 TarsDict(dict) 复制一遍解码结果
+    let dict = Bound::new(py, TarsDict)
+        .map_err(DeError::wrap)?
+        .into_any()
+        .cast_into::<PyDict>()
+        .map_err(|e| DeError::wrap(e.into()))?;
     while !reader.is_end() {
         let (tag, type_id) = reader
             .read_head()
@@ -384,20 +513,32 @@ fn decode_any_list<'py>(
         }
         Bound::from_owned_ptr(py, ptr)
     };
+    // 整数元素不会继续递归, 深度满足时直接读取, 跳过 decode_any_value 的分发
+    let leaf_depth_ok = depth + 1 < MAX_DEPTH;
+    let list_ptr = list_any.as_ptr();
     for idx in 0..len {
         let (_, item_type) = reader
             .read_head()
             .map_err(|e| DeError::new(format!("Failed to read list item head: {e}")))?;
-        let item = decode_any_value(py, reader, item_type, depth + 1)
-            .map_err(|e| e.prepend(PathItem::Index(idx)))?;
-        let set_res = unsafe {
-            // SAFETY: PyList_SetItem 会“偷”引用, item.into_ptr 转移所有权。
-            // 每个索引只写入一次,与 PyList_New 的预分配长度一致。
-            ffi::PyList_SetItem(list_any.as_ptr(), idx as isize, item.into_ptr())
-        };
-        if set_res != 0 {
-            return Err(DeError::wrap(PyErr::fetch(py)));
+        let item = if leaf_depth_ok
+            && matches!(
+                item_type,
+                TarsType::ZeroTag
+                    | TarsType::Int1
+                    | TarsType::Int2
+                    | TarsType::Int4
+                    | TarsType::Int8
+            ) {
+            decode_any_int(py, reader, item_type)
+        } else {
+            decode_any_value(py, reader, item_type, depth + 1)
         }
+        .map_err(|e| e.prepend(PathItem::Index(idx)))?;
+        // SAFETY:
+        // 1. `list_ptr` 指向上方以 `PyList_New(len)` 新建、尚未暴露给 Python 的列表.
+        // 2. `idx < len`, 且每个槽位只写入一次, 原槽位为 NULL, 无需释放旧值.
+        // 3. `PyList_SET_ITEM` 偷取引用, `into_ptr` 转移所有权.
+        unsafe { ffi::PyList_SET_ITEM(list_ptr, idx as ffi::Py_ssize_t, item.into_ptr()) };
     }
     Ok(list_any)
 }
@@ -424,10 +565,15 @@ fn decode_any_map<'py>(
         let val = decode_any_value(py, reader, vt, depth + 1)
             .map_err(|e| e.prepend(PathItem::Key(key.to_string())))?;
 
-        if key.hash().is_err() {
-            return Err(DeError::new("Map key must be hashable".into()));
-        }
-        dict.set_item(key, val).map_err(DeError::wrap)?;
+        // set_item 本身会计算 hash, 不可哈希的 key(list/dict)在此抛出 TypeError,
+        // 无需预先单独调用 hash()
+        dict.set_item(key, val).map_err(|e| {
+            if e.is_instance_of::<PyTypeError>(py) {
+                DeError::new("Map key must be hashable".into())
+            } else {
+                DeError::wrap(e)
+            }
+        })?;
     }
     Ok(dict.into_any())
 }
@@ -488,7 +634,7 @@ fn encode_raw_value_to_pybytes(py: Python<'_>, obj: &Bound<'_, PyAny>) -> PyResu
 /// 将 Tars 二进制数据解码为 TarsDict.
 ///
 /// Args:
-///     data: 待解码的 bytes.
+///     data: 待解码的 bytes-like 对象, bytes 及基于 bytes 的 memoryview 直接借用, 其余先拷贝.
 ///
 /// Returns:
 ///     解码后的 dict[int, TarsValue] (实际返回 TarsDict 实例).
@@ -497,9 +643,8 @@ fn encode_raw_value_to_pybytes(py: Python<'_>, obj: &Bound<'_, PyAny>) -> PyResu
 ///     ValueError: 数据格式不正确、存在 trailing bytes、或递归深度超过 MAX_DEPTH.
 #[pyfunction]
 pub fn decode_raw<'py>(py: Python<'py>, data: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyDict>> {
-    let bytes = try_coerce_buffer_to_bytes(data)?
-        .ok_or_else(|| PyTypeError::new_err("argument 'data': expected a bytes-like object"))?;
-    decode_raw_from_bytes(py, bytes.as_bytes())
+    with_input_bytes(data, |bytes| decode_raw_from_bytes(py, bytes))?
+        .ok_or_else(|| PyTypeError::new_err("argument 'data': expected a bytes-like object"))?
 }
 
 pub fn decode_raw_from_bytes<'py>(py: Python<'py>, data: &[u8]) -> PyResult<Bound<'py, PyDict>> {
@@ -529,16 +674,7 @@ fn encode_raw_dict_to_pybytes(
         {
             let mut writer = TarsWriter::with_buffer(&mut *buffer);
             // Top-level object for encode_raw must be a Struct (dict[int, TarsValue])
-            let mut fields: SmallVec<[(u8, Bound<'_, PyAny>); 16]> = SmallVec::with_capacity(dict.len());
-            for (key, value) in dict.iter() {
-                if value.is_none() {
-                    continue;
-                }
-                let tag = key
-                    .extract::<u8>()
-                    .map_err(|_| PyTypeError::new_err("Struct tag must be int in range 0-255"))?;
-                fields.push((tag, value));
-            }
+            let fields = collect_sorted_tag_items(dict)?;
             write_struct_fields_from_vec(&mut writer, fields, depth)?;
         }
 
@@ -557,10 +693,7 @@ fn write_struct_fields_from_vec(
 ) -> PyResult<()> {
     check_depth(depth)?;
 
-    let mut sorted_items = items;
-    sorted_items.sort_by_key(|(tag, _)| *tag);
-
-    for (tag, value) in sorted_items {
+    for (tag, value) in items {
         encode_value(writer, tag, &value, depth + 1)?;
     }
 
@@ -630,12 +763,23 @@ fn decode_value<'py>(
 /// 启发式探测字节数据是否为一个有效的 Tars Struct.
 ///
 /// Args:
-///     data: 可能包含 Tars Struct 的 bytes.
+///     data: 可能包含 Tars Struct 的 bytes-like 对象, bytes 及基于 bytes 的 memoryview 直接借用.
 ///
 /// Returns:
 ///     若解析成功且完全消费输入,返回 TarsDict;否则返回 None.
+///
+/// Raises:
+///     TypeError: data 不是 bytes-like 对象.
 #[pyfunction]
-pub fn probe_struct<'py>(py: Python<'py>, data: &[u8]) -> Option<Bound<'py, PyDict>> {
+pub fn probe_struct<'py>(
+    py: Python<'py>,
+    data: &Bound<'py, PyAny>,
+) -> PyResult<Option<Bound<'py, PyDict>>> {
+    with_input_bytes(data, |bytes| probe_struct_from_bytes(py, bytes))?
+        .ok_or_else(|| PyTypeError::new_err("argument 'data': expected a bytes-like object"))
+}
+
+fn probe_struct_from_bytes<'py>(py: Python<'py>, data: &[u8]) -> Option<Bound<'py, PyDict>> {
     if data.is_empty() {
         return None;
     }
@@ -1,7 +1,9 @@
 use pyo3::exceptions::{PyRuntimeError, PyTypeError};
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyBytes, PyDict, PyFrozenSet, PySequence, PySet, PyString};
 use std::cell::RefCell;
+use std::sync::LazyLock;
 
 use bytes::BufMut;
 
@@ -9,15 +11,27 @@ use crate::binding::codec::raw::{serialize_any, serialize_struct_fields, write_t
 use crate::binding::ir::{StructDef, TypeExpr, UnionCache, WireType};
 use crate::binding::schema::{TarsDict, ensure_schema_for_class};
 use crate::binding::utils::{
-    PySequenceFast, check_depth, check_exact_sequence_type, class_from_type, dataclass_fields,
-    maybe_shrink_buffer, try_coerce_buffer_to_bytes,
+    MAX_DEPTH, PySequenceFast, check_depth, check_exact_sequence_type, class_from_type,
+    dataclass_fields, maybe_shrink_buffer, with_buffer_bytes,
 };
 use crate::binding::validation::value_matches_type;
 use crate::codec::consts::TarsType;
 use crate::codec::writer::TarsWriter;
 
+/// 载荷缓冲区池保留的缓冲区数量上限, 对应可复用的 wrap_simplelist 嵌套层数.
+const PAYLOAD_BUFFER_POOL_LIMIT: usize = 8;
+
+/// TypedDict 按 `map[str, Any]` 编码. 目标类型只构造一次, 避免每个值都分配两个 Box.
+static TYPED_DICT_MAP_EXPR: LazyLock<TypeExpr> = LazyLock::new(|| {
+    TypeExpr::Map(
+        Box::new(TypeExpr::Primitive(WireType::String)),
+        Box::new(TypeExpr::Any),
+    )
+});
+
 thread_local! {
     static ENCODE_BUFFER: RefCell<Vec<u8>> = RefCell::new(Vec::with_capacity(128));
+    static PAYLOAD_BUFFER_POOL: RefCell<Vec<Vec<u8>>> = const { RefCell::new(Vec::new()) };
 }
 
 fn serialize_tuple_like(
@@ -105,45 +119,77 @@ pub fn encode_object_to_pybytes(py: Python<'_>, obj: &Bound<'_, PyAny>) -> PyRes
     })
 }
 
-pub(crate) fn encode_struct_payload_to_vec(
+/// 从线程内缓冲区池借出一个空缓冲区, 执行 `f` 后归还.
+///
+/// wrap_simplelist 字段需要先把嵌套载荷编码到独立缓冲区再作为 bytes 写出;
+/// 载荷内部可能再次嵌套 wrap_simplelist, 因此按栈借还, 而不是独占借用单个缓冲区.
+fn with_payload_buffer<R>(f: impl FnOnce(&mut Vec<u8>) -> PyResult<R>) -> PyResult<R> {
+    let mut payload = PAYLOAD_BUFFER_POOL
+        .with(|pool| pool.borrow_mut().pop())
+        .unwrap_or_else(|| Vec::with_capacity(64));
+    payload.clear();
+
+    let result = f(&mut payload);
+
+    maybe_shrink_buffer(&mut payload);
+    PAYLOAD_BUFFER_POOL.with(|pool| {
+        let mut pool = pool.borrow_mut();
+        if pool.len() < PAYLOAD_BUFFER_POOL_LIMIT {
+            pool.push(payload);
+        }
+    });
+    result
+}
+
+/// 将 Struct 的字段编码为独立载荷, 并以 SimpleList(bytes) 写入 `tag`.
+pub(crate) fn write_struct_payload<W: BufMut>(
+    writer: &mut TarsWriter<W>,
+    tag: u8,
     obj: &Bound<'_, PyAny>,
     def: &StructDef,
     depth: usize,
-) -> PyResult<Vec<u8>> {
-    let mut payload = Vec::with_capacity(64);
-    {
-        let mut nested_writer = TarsWriter::with_buffer(&mut payload);
-        serialize_struct_fields(
-            &mut nested_writer,
-            obj,
-            def,
-            depth + 1,
-            true,
-            &serialize_impl_standard,
-        )?;
-    }
-    Ok(payload)
+) -> PyResult<()> {
+    with_payload_buffer(|payload| {
+        {
+            let mut nested_writer = TarsWriter::with_buffer(&mut *payload);
+            serialize_struct_fields(
+                &mut nested_writer,
+                obj,
+                def,
+                depth + 1,
+                true,
+                &serialize_impl_standard,
+            )?;
+        }
+        writer.write_bytes(tag, payload);
+        Ok(())
+    })
 }
 
-pub(crate) fn encode_tarsdict_payload_to_vec(
+/// 将 TarsDict 编码为独立载荷, 并以 SimpleList(bytes) 写入 `tag`.
+pub(crate) fn write_tarsdict_payload<W: BufMut>(
+    writer: &mut TarsWriter<W>,
+    tag: u8,
     val: &Bound<'_, PyAny>,
     depth: usize,
-) -> PyResult<Vec<u8>> {
+) -> PyResult<()> {
     if !val.is_instance_of::<TarsDict>() {
         return Err(PyTypeError::new_err("TarsDict value type mismatch"));
     }
     let dict = val.cast::<PyDict>()?;
-    let mut payload = Vec::with_capacity(64);
-    {
-        let mut nested_writer = TarsWriter::with_buffer(&mut payload);
-        write_tarsdict_fields(
-            &mut nested_writer,
-            dict,
-            depth + 1,
-            &serialize_impl_standard,
-        )?;
-    }
-    Ok(payload)
+    with_payload_buffer(|payload| {
+        {
+            let mut nested_writer = TarsWriter::with_buffer(&mut *payload);
+            write_tarsdict_fields(
+                &mut nested_writer,
+                dict,
+                depth + 1,
+                &serialize_impl_standard,
+            )?;
+        }
+        writer.write_bytes(tag, payload);
+        Ok(())
+    })
 }
 
 pub(crate) fn serialize_impl(
@@ -161,9 +207,8 @@ pub(crate) fn serialize_impl(
             serialize_any(writer, tag, val, depth + 1, &serialize_impl_standard)?;
         }
         TypeExpr::Bytes => {
-            let bytes = try_coerce_buffer_to_bytes(val)?
+            with_buffer_bytes(val, |bytes| writer.write_bytes(tag, bytes))?
                 .ok_or_else(|| PyTypeError::new_err("Bytes value must be bytes-like"))?;
-            writer.write_bytes(tag, bytes.as_bytes());
         }
         TypeExpr::NoneType => {
             return Err(PyTypeError::new_err(
@@ -182,16 +227,9 @@ pub(crate) fn serialize_impl(
             serialize_list_like(writer, tag, type_expr, val, depth)?;
         }
         TypeExpr::Map(_, _) => serialize_map_like(writer, tag, type_expr, val, depth)?,
-        TypeExpr::TypedDict => serialize_map_like(
-            writer,
-            tag,
-            &TypeExpr::Map(
-                Box::new(TypeExpr::Primitive(WireType::String)),
-                Box::new(TypeExpr::Any),
-            ),
-            val,
-            depth,
-        )?,
+        TypeExpr::TypedDict => {
+            serialize_map_like(writer, tag, &TYPED_DICT_MAP_EXPR, val, depth)?;
+        }
         TypeExpr::Optional(_) => serialize_optional(writer, tag, type_expr, val, depth)?,
     }
     Ok(())
@@ -254,7 +292,7 @@ pub(crate) fn serialize_enum(
         if !val.is_instance(enum_type.as_any())? {
             return Err(PyTypeError::new_err("Enum value type mismatch"));
         }
-        let value = val.getattr("value")?;
+        let value = val.getattr(intern!(val.py(), "value"))?;
         serialize_impl(writer, tag, inner, &value, depth + 1)?;
     }
     Ok(())
@@ -341,9 +379,8 @@ pub(crate) fn serialize_list_like(
     match type_expr {
         TypeExpr::List(inner) | TypeExpr::VarTuple(inner) => {
             if matches!(**inner, TypeExpr::Primitive(WireType::Int))
-                && let Some(bytes) = try_coerce_buffer_to_bytes(val)?
+                && with_buffer_bytes(val, |bytes| writer.write_bytes(tag, bytes))?.is_some()
             {
-                writer.write_bytes(tag, bytes.as_bytes());
                 return Ok(());
             }
 
@@ -352,6 +389,14 @@ pub(crate) fn serialize_list_like(
                 let seq_fast = PySequenceFast::new_exact(val, is_list)?;
                 let len = seq_fast.len();
                 writer.write_int(0, len as i64);
+                // 基本类型元素(含整数)跳过逐元素的 serialize_impl 分发与深度检查
+                if depth + 1 < MAX_DEPTH && matches!(**inner, TypeExpr::Primitive(_)) {
+                    for i in 0..len {
+                        let item = seq_fast.get_item(val.py(), i)?;
+                        serialize_primitive(writer, 0, inner, &item, depth + 1)?;
+                    }
+                    return Ok(());
+                }
                 for i in 0..len {
                     let item = seq_fast.get_item(val.py(), i)?;
                     serialize_impl(writer, 0, inner, &item, depth + 1)?;
@@ -1,3 +1,4 @@
+use pyo3::exceptions::PyTypeError;
 use pyo3::prelude::*;
 use pyo3::types::{PyBytes, PyDict, PyList, PyType};
 use simdutf8::basic::from_utf8;
@@ -5,13 +6,17 @@ use std::sync::Arc;
 
 use crate::binding::ir::{StructDef, TypeExpr};
 use crate::binding::schema::ensure_schema_for_class;
+use crate::binding::utils::with_input_bytes;
 use crate::codec::consts::TarsType;
 use crate::codec::reader::TarsReader;
 
+/// 追踪帧栈的初始容量.
+const TRACE_STACK_CAPACITY: usize = 16;
+
 #[pyclass(module = "tarsio._core", get_all)]
 pub struct TraceNode {
     pub tag: u8,
-    pub jce_type: String,
+    pub jce_type: &'static str,
     pub value: Option<Py<PyAny>>,
     pub children: Vec<Py<TraceNode>>,
     pub name: Option<String>,
@@ -49,9 +54,20 @@ impl TraceNode {
 }
 
 /// 解析二进制数据并生成追踪树.
+///
+/// `data` 接受 bytes 及 bytes-like 对象; 其中 bytes 与基于 bytes 的 memoryview 直接借用, 其余先拷贝.
 #[pyfunction]
 #[pyo3(signature = (data, cls=None))]
 pub fn decode_trace<'py>(
+    py: Python<'py>,
+    data: &Bound<'py, PyAny>,
+    cls: Option<&Bound<'py, PyType>>,
+) -> PyResult<Py<TraceNode>> {
+    with_input_bytes(data, |bytes| decode_trace_from_bytes(py, bytes, cls))?
+        .ok_or_else(|| PyTypeError::new_err("argument 'data': expected a bytes-like object"))?
+}
+
+fn decode_trace_from_bytes<'py>(
     py: Python<'py>,
     data: &[u8],
     cls: Option<&Bound<'py, PyType>>,
@@ -68,7 +84,7 @@ pub fn decode_trace<'py>(
         py,
         TraceNode {
             tag: 0,
-            jce_type: "ROOT".to_string(),
+            jce_type: "ROOT",
             value: None,
             children: Vec::new(),
             name: None,
@@ -77,12 +93,14 @@ pub fn decode_trace<'py>(
         },
     )?;
 
-    let mut stack = vec![TraceFrame::Struct(StructFrame {
+    // 每层嵌套约压入容器帧与值帧两帧, 预留容量使常见的浅层数据无需扩容
+    let mut stack = Vec::with_capacity(TRACE_STACK_CAPACITY);
+    stack.push(TraceFrame::Struct(StructFrame {
         parent: root.clone_ref(py),
         def,
         parent_path: "<root>".to_string(),
         depth: 0,
-    })];
+    }));
     run_trace_frames(py, &mut reader, &mut stack)?;
 
     Ok(root)
@@ -146,15 +164,21 @@ enum TraceFrame {
 #[inline]
 fn check_trace_depth(depth: usize) -> PyResult<()> {
     if depth >= crate::binding::utils::MAX_DEPTH {
-        return Err(pyo3::exceptions::PyValueError::new_err(format!(
-            "Trace recursion depth exceeded (max={}, observed={})",
-            crate::binding::utils::MAX_DEPTH,
-            depth
-        )));
+        return Err(trace_depth_exceeded(depth));
     }
     Ok(())
 }
 
+#[cold]
+#[inline(never)]
+fn trace_depth_exceeded(depth: usize) -> PyErr {
+    pyo3::exceptions::PyValueError::new_err(format!(
+        "Trace recursion depth exceeded (max={}, observed={})",
+        crate::binding::utils::MAX_DEPTH,
+        depth
+    ))
+}
+
 fn type_hint_from_expr(py: Python<'_>, type_expr: Option<&TypeExpr>) -> Option<TraceTypeHint> {
     match type_expr? {
         TypeExpr::Struct(cls_obj) => {
@@ -202,8 +226,7 @@ fn run_trace_frames<'py>(
                 let mut type_name = None;
                 let mut field_hint = None;
                 if let Some(def) = frame.def.as_deref()
-                    && (tag as usize) < def.tag_lookup_vec.len()
-                    && let Some(idx) = def.tag_lookup_vec[tag as usize]
+                    && let Some(idx) = def.field_index(tag)
                 {
                     let f = &def.fields_sorted[idx];
                     name = Some(f.name.clone());
@@ -221,7 +244,7 @@ fn run_trace_frames<'py>(
                     py,
                     TraceNode {
                         tag,
-                        jce_type: format!("{:?}", type_id),
+                        jce_type: type_id.name(),
                         value: None,
                         children: Vec::new(),
                         name,
@@ -290,12 +313,17 @@ fn run_trace_frames<'py>(
                 }
                 TarsType::List => {
                     let len = reader.read_size().unwrap_or(0) as usize;
-                    frame.node.borrow_mut(py).value = Some(
-                        format!("<List len={}>", len)
-                            .into_pyobject(py)?
-                            .into_any()
-                            .unbind(),
-                    );
+                    {
+                        let mut node = frame.node.borrow_mut(py);
+                        node.value = Some(
+                            format!("<List len={}>", len)
+                                .into_pyobject(py)?
+                                .into_any()
+                                .unbind(),
+                        );
+                        // 预留子节点容量; 每个元素至少占 1 字节, 按剩余字节数截断以防恶意长度
+                        node.children.reserve(len.min(reader.remaining().len()));
+                    }
                     let inner_hint = match frame.type_hint {
                         Some(TraceTypeHint::List(inner)) => Some(*inner),
                         _ => None,
@@ -311,12 +339,18 @@ fn run_trace_frames<'py>(
                 }
                 TarsType::Map => {
                     let len = reader.read_size().unwrap_or(0) as usize;
-                    frame.node.borrow_mut(py).value = Some(
-                        format!("<Map len={}>", len)
-                            .into_pyobject(py)?
-                            .into_any()
-                            .unbind(),
-                    );
+                    {
+                        let mut node = frame.node.borrow_mut(py);
+                        node.value = Some(
+                            format!("<Map len={}>", len)
+                                .into_pyobject(py)?
+                                .into_any()
+                                .unbind(),
+                        );
+                        // 预留子节点容量; 每个元素至少占 1 字节, 按剩余字节数截断以防恶意长度
+                        node.children
+                            .reserve(len.saturating_mul(2).min(reader.remaining().len()));
+                    }
                     let (key_hint, val_hint) = match frame.type_hint {
                         Some(TraceTypeHint::Map(key, val)) => (Some(*key), Some(*val)),
                         _ => (None, None),
@@ -338,7 +372,7 @@ fn run_trace_frames<'py>(
                     let bytes = reader.read_bytes(len).unwrap_or(&[]);
                     frame.node.borrow_mut(py).value =
                         Some(PyBytes::new(py, bytes).into_any().unbind());
-                    frame.node.borrow_mut(py).jce_type = "SimpleList".to_string();
+                    frame.node.borrow_mut(py).jce_type = "SimpleList";
                 }
                 _ => {
                     frame.node.borrow_mut(py).value =
@@ -356,7 +390,7 @@ fn run_trace_frames<'py>(
                     py,
                     TraceNode {
                         tag,
-                        jce_type: format!("{:?}", item_type_id),
+                        jce_type: item_type_id.name(),
                         value: None,
                         children: Vec::new(),
                         name: None,
@@ -399,7 +433,7 @@ fn run_trace_frames<'py>(
                             py,
                             TraceNode {
                                 tag: ktag,
-                                jce_type: format!("{:?}", ktype),
+                                jce_type: ktype.name(),
                                 value: None,
                                 children: Vec::new(),
                                 name: Some("<key>".into()),
@@ -450,7 +484,7 @@ fn run_trace_frames<'py>(
                             py,
                             TraceNode {
                                 tag: vtag,
-                                jce_type: format!("{:?}", vtype),
+                                jce_type: vtype.name(),
                                 value: None,
                                 children: Vec::new(),
                                 name: Some(format!("value_of_{}", key_repr)),
@@ -1,10 +1,12 @@
 use pyo3::prelude::*;
+use pyo3::sync::PyOnceLock;
 use pyo3::types::{PyAny, PyDict, PyList, PyString, PyTuple, PyType};
+use std::cell::RefCell;
 use std::collections::HashMap;
 use std::sync::Arc;
 
 use crate::binding::core::{
-    SCHEMA_ATTR, SCHEMA_CACHE, Schema, SchemaConfig, StructConfig, is_nodefault,
+    SCHEMA_ATTR, Schema, SchemaConfig, StructConfig, cache_schema, is_nodefault,
     nodefault_singleton,
 };
 use crate::binding::ir::{
@@ -160,18 +162,22 @@ fn compile_schema_from_fields<'py>(
         }
     }
 
-    fields_def.sort_by_key(|f| f.tag);
+    // 内省路径产出的字段已按 Tag 升序, 仅 schema_info 路径可能需要排序
+    if !fields_def.is_sorted_by_key(|f| f.tag) {
+        fields_def.sort_by_key(|f| f.tag);
+    }
 
+    // 排序后最后一个字段即最大 Tag, 名称索引与 Tag 查找表在同一趟遍历中建好
+    let max_tag = fields_def.last().map_or(0, |f| f.tag);
     let mut name_to_index = HashMap::with_capacity(fields_def.len());
     let mut name_ptr_to_index = HashMap::with_capacity(fields_def.len());
-    let mut max_tag = 0;
+    let mut tag_lookup_vec = vec![None; (max_tag as usize) + 1];
 
     for (idx, f) in fields_def.iter().enumerate() {
         name_to_index.insert(f.name.clone(), idx);
         name_ptr_to_index.insert(f.name_py.as_ptr() as usize, idx);
-        if f.tag > max_tag {
-            max_tag = f.tag;
-        }
+        // Tag 在编译期已去重, 字段数不超过 256, 索引必然落在 u8 范围内
+        tag_lookup_vec[f.tag as usize] = Some(idx as u8);
     }
 
     let meta = Arc::new(StructMetaData {
@@ -179,11 +185,6 @@ fn compile_schema_from_fields<'py>(
         name_ptr_to_index,
     });
 
-    let mut tag_lookup_vec = vec![None; (max_tag as usize) + 1];
-    for (idx, f) in fields_def.iter().enumerate() {
-        tag_lookup_vec[f.tag as usize] = Some(idx);
-    }
-
     let def = StructDef {
         class_ptr: cls.as_ptr() as usize,
         name: cls.name()?.to_string(),
@@ -204,21 +205,13 @@ fn compile_schema_from_fields<'py>(
     let def = Arc::new(def);
     let capsule = schema_to_python(py, Arc::clone(&def))?;
     cls.setattr(SCHEMA_ATTR, capsule)?;
-    SCHEMA_CACHE.with(|cache| {
-        cache
-            .borrow_mut()
-            .insert(cls.as_ptr() as usize, Arc::downgrade(&def));
-    });
+    cache_schema(cls, &def);
 
-    let mut field_names = Vec::with_capacity(def.fields_sorted.len());
-    for field in &def.fields_sorted {
-        field_names.push(field.name_py.bind(py).to_owned().into_any().unbind());
-    }
-    let fields_tuple = PyTuple::new(py, field_names)?;
+    let fields_tuple = PyTuple::new(py, def.fields_sorted.iter().map(|f| f.name_py.bind(py)))?;
     cls.setattr("__struct_fields__", &fields_tuple)?;
     cls.setattr("__match_args__", &fields_tuple)?;
 
-    let struct_config = Py::new(py, StructConfig::from_schema_config(&config))?;
+    let struct_config = StructConfig::shared(py, &config)?;
     cls.setattr("__struct_config__", struct_config)?;
 
     let signature = build_signature(py, &def, &config)?;
@@ -305,15 +298,7 @@ fn constraints_ir_to_constraints(
     }
 
     let pattern = if let Some(p) = c.pattern.as_deref() {
-        let re = py.import("re")?;
-        let compile = re.getattr("compile")?;
-        let pattern_obj = compile.call1((p,)).map_err(|e| {
-            pyo3::exceptions::PyTypeError::new_err(format!(
-                "Invalid regex pattern for field '{}': {}",
-                field_name, e
-            ))
-        })?;
-        Some(pattern_obj.unbind())
+        Some(compile_pattern(py, p, field_name)?)
     } else {
         None
     };
@@ -329,10 +314,62 @@ fn constraints_ir_to_constraints(
     })))
 }
 
+thread_local! {
+    // 线程内正则缓存: 相同 pattern 字符串在多个类/字段间共享同一个编译结果.
+    static PATTERN_CACHE: RefCell<HashMap<String, Py<PyAny>>> = RefCell::new(HashMap::new());
+}
+
+static RE_COMPILE: PyOnceLock<Py<PyAny>> = PyOnceLock::new();
+
+/// 编译字段约束中的正则, 结构相同的约束复用已编译对象.
+fn compile_pattern(py: Python<'_>, pattern: &str, field_name: &str) -> PyResult<Py<PyAny>> {
+    if let Some(hit) = PATTERN_CACHE.with(|c| c.borrow().get(pattern).map(|p| p.clone_ref(py))) {
+        return Ok(hit);
+    }
+    let compile = RE_COMPILE.get_or_try_init(py, || {
+        Ok::<_, PyErr>(py.import("re")?.getattr("compile")?.unbind())
+    })?;
+    let compiled = compile.bind(py).call1((pattern,)).map_err(|e| {
+        pyo3::exceptions::PyTypeError::new_err(format!(
+            "Invalid regex pattern for field '{}': {}",
+            field_name, e
+        ))
+    })?;
+    let compiled = compiled.unbind();
+    PATTERN_CACHE.with(|c| {
+        c.borrow_mut()
+            .insert(pattern.to_owned(), compiled.clone_ref(py))
+    });
+    Ok(compiled)
+}
+
+/// `inspect` 中构建签名所需的对象, 首次建类时解析一次, 之后所有类复用.
+struct SignatureTypes {
+    parameter: Py<PyAny>,
+    signature: Py<PyAny>,
+    keyword_only: Py<PyAny>,
+    positional_or_keyword: Py<PyAny>,
+}
+
+static SIGNATURE_TYPES: PyOnceLock<SignatureTypes> = PyOnceLock::new();
+
+fn signature_types(py: Python<'_>) -> PyResult<&'static SignatureTypes> {
+    SIGNATURE_TYPES.get_or_try_init(py, || {
+        let inspect = py.import("inspect")?;
+        let parameter = inspect.getattr("Parameter")?;
+        Ok::<_, PyErr>(SignatureTypes {
+            keyword_only: parameter.getattr("KEYWORD_ONLY")?.unbind(),
+            positional_or_keyword: parameter.getattr("POSITIONAL_OR_KEYWORD")?.unbind(),
+            signature: inspect.getattr("Signature")?.unbind(),
+            parameter: parameter.unbind(),
+        })
+    })
+}
+
 fn build_signature(py: Python<'_>, def: &StructDef, config: &SchemaConfig) -> PyResult<Py<PyAny>> {
-    let inspect = py.import("inspect")?;
-    let param_cls = inspect.getattr("Parameter")?;
-    let sig_cls = inspect.getattr("Signature")?;
+    let types = signature_types(py)?;
+    let param_cls = types.parameter.bind(py);
+    let sig_cls = types.signature.bind(py);
     let params = PyList::empty(py);
     let nodefault = nodefault_singleton(py)?;
     let mut seen_default = false;
@@ -353,9 +390,9 @@ fn build_signature(py: Python<'_>, def: &StructDef, config: &SchemaConfig) -> Py
         }
 
         let kind = if config.kw_only || (seen_default && !has_default) {
-            param_cls.getattr("KEYWORD_ONLY")?
+            types.keyword_only.bind(py)
         } else {
-            param_cls.getattr("POSITIONAL_OR_KEYWORD")?
+            types.positional_or_keyword.bind(py)
         };
 
         if has_default {
@@ -491,17 +528,7 @@ fn parse_constraints(
     }
 
     let pattern = match pattern_str.as_deref() {
-        Some(p) => {
-            let py = obj.py();
-            let re_module = py.import("re")?;
-            let pattern_obj = re_module.call_method1("compile", (p,)).map_err(|e| {
-                pyo3::exceptions::PyTypeError::new_err(format!(
-                    "Invalid regex pattern for field '{}': {}",
-                    field_name, e
-                ))
-            })?;
-            Some(pattern_obj.unbind())
-        }
+        Some(p) => Some(compile_pattern(obj.py(), p, field_name)?),
         None => None,
     };
 
@@ -1,7 +1,8 @@
 use parking_lot::RwLock;
 use pyo3::gc::{PyTraverseError, PyVisit};
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyDict, PyString, PyType};
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyAny, PyDict, PyString, PyType, PyWeakrefMethods, PyWeakrefReference};
 use rustc_hash::FxHashMap;
 use std::cell::RefCell;
 use std::collections::HashMap;
@@ -160,6 +161,23 @@ pub struct FieldDef {
     pub constraints: Option<Box<Constraints>>,
 }
 
+impl FieldDef {
+    /// 判断取值是否等于字段的静态默认值, 供 omit_defaults/repr_omit_defaults 使用.
+    ///
+    /// 默认值多为共享的不可变对象(小整数、驻留字符串等), 先比较指针,
+    /// 命中时无需进入 Python 的 `__eq__`. 无静态默认值(含仅有工厂)时返回 false.
+    #[inline]
+    pub fn equals_default(&self, value: &Bound<'_, PyAny>) -> PyResult<bool> {
+        match &self.default_value {
+            Some(default_val) => {
+                let default_val = default_val.bind(value.py());
+                Ok(value.is(default_val) || value.eq(default_val)?)
+            }
+            None => Ok(false),
+        }
+    }
+}
+
 #[derive(Debug)]
 pub struct StructMetaData {
     pub name_to_index: HashMap<String, usize>,
@@ -171,7 +189,8 @@ pub struct StructDef {
     pub class_ptr: usize,
     pub name: String,
     pub fields_sorted: Vec<FieldDef>,
-    pub tag_lookup_vec: Vec<Option<usize>>,
+    /// 以 Tag 为下标的字段索引表. Tag 唯一且不超过 255, 因此索引可用 u8 紧凑存储.
+    pub tag_lookup_vec: Vec<Option<u8>>,
     pub meta: Arc<StructMetaData>,
     pub frozen: bool,
     pub order: bool,
@@ -184,6 +203,18 @@ pub struct StructDef {
     pub weakref: bool,
 }
 
+impl StructDef {
+    /// 按 Tag 查找字段在 `fields_sorted` 中的索引.
+    #[inline]
+    pub fn field_index(&self, tag: u8) -> Option<usize> {
+        self.tag_lookup_vec
+            .get(tag as usize)
+            .copied()
+            .flatten()
+            .map(usize::from)
+    }
+}
+
 #[derive(Debug, Clone, Copy)]
 pub struct SchemaConfig {
     pub frozen: bool,
@@ -197,7 +228,7 @@ pub struct SchemaConfig {
     pub weakref: bool,
 }
 
-#[pyclass(module = "tarsio._core")]
+#[pyclass(frozen, module = "tarsio._core")]
 pub struct StructConfig {
     #[pyo3(get)]
     pub frozen: bool,
@@ -233,6 +264,33 @@ impl StructConfig {
             rename: None,
         }
     }
+
+    /// 获取与配置对应的共享 `StructConfig` 实例.
+    ///
+    /// 实例不可变, 而大多数类使用相同的配置组合, 按 8 个布尔开关共享同一对象,
+    /// 不再为每个类单独分配.
+    pub fn shared(py: Python<'_>, config: &SchemaConfig) -> PyResult<Py<StructConfig>> {
+        let key = u8::from(config.frozen)
+            | u8::from(config.eq) << 1
+            | u8::from(config.order) << 2
+            | u8::from(config.kw_only) << 3
+            | u8::from(config.repr_omit_defaults) << 4
+            | u8::from(config.omit_defaults) << 5
+            | u8::from(config.weakref) << 6
+            | u8::from(config.dict) << 7;
+        if let Some(hit) =
+            STRUCT_CONFIG_CACHE.with(|c| c.borrow().get(&key).map(|v| v.clone_ref(py)))
+        {
+            return Ok(hit);
+        }
+        let obj = Py::new(py, StructConfig::from_schema_config(config))?;
+        STRUCT_CONFIG_CACHE.with(|c| c.borrow_mut().insert(key, obj.clone_ref(py)));
+        Ok(obj)
+    }
+}
+
+thread_local! {
+    static STRUCT_CONFIG_CACHE: RefCell<FxHashMap<u8, Py<StructConfig>>> = RefCell::new(FxHashMap::default());
 }
 
 /// 字段元数据与约束定义.
@@ -281,7 +339,7 @@ impl Meta {
 }
 
 /// `field` 默认值哨兵类型.
-#[pyclass(module = "tarsio._core", name = "_NoDefaultType")]
+#[pyclass(frozen, module = "tarsio._core", name = "_NoDefaultType")]
 pub struct NoDefaultType;
 
 #[pymethods]
@@ -292,7 +350,7 @@ impl NoDefaultType {
 }
 
 /// 字段默认值规格（内部使用）.
-#[pyclass(module = "tarsio._core", name = "_FieldSpec")]
+#[pyclass(frozen, module = "tarsio._core", name = "_FieldSpec")]
 pub struct FieldSpec {
     pub tag: Option<u8>,
     pub has_default: bool,
@@ -301,17 +359,25 @@ pub struct FieldSpec {
     pub wrap_simplelist: bool,
 }
 
+static NODEFAULT: PyOnceLock<Py<PyAny>> = PyOnceLock::new();
+
 /// 获取 `NODEFAULT` 单例.
+///
+/// 首次调用时从 `tarsio._core` 取出并缓存, 之后构建签名/字段信息时不再重复导入模块.
 pub fn nodefault_singleton(py: Python<'_>) -> PyResult<Py<PyAny>> {
-    let core = py.import("tarsio._core")?;
-    Ok(core.getattr("NODEFAULT")?.unbind())
+    let nodefault = NODEFAULT.get_or_try_init(py, || {
+        let core = py.import("tarsio._core")?;
+        Ok::<_, PyErr>(core.getattr("NODEFAULT")?.unbind())
+    })?;
+    Ok(nodefault.clone_ref(py))
 }
 
 /// 判断对象是否为 `NODEFAULT` 哨兵.
+///
+/// `_NoDefaultType` 无法从 Python 侧构造, 模块初始化时创建的实例是唯一实例,
+/// 因此按类型判断即可, 无需每次导入 `tarsio._core` 取单例.
 pub fn is_nodefault(obj: &Bound<'_, PyAny>) -> PyResult<bool> {
-    let py = obj.py();
-    let nodefault = nodefault_singleton(py)?;
-    Ok(obj.is(nodefault.bind(py)))
+    Ok(obj.is_exact_instance_of::<NoDefaultType>())
 }
 
 /// 创建字段默认值规格.
@@ -323,8 +389,6 @@ pub fn is_nodefault(obj: &Bound<'_, PyAny>) -> PyResult<bool> {
 ///     TypeError: 参数非法、未知关键字、或默认值与工厂冲突时抛出。
 #[pyfunction(signature = (**kwargs))]
 pub fn field(py: Python<'_>, kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<Py<FieldSpec>> {
-    let nodefault = nodefault_singleton(py)?;
-    let nodefault_ref = nodefault.bind(py);
     let mut tag: Option<u8> = None;
     let mut default_value: Option<Py<PyAny>> = None;
     let mut default_factory: Option<Py<PyAny>> = None;
@@ -332,10 +396,12 @@ pub fn field(py: Python<'_>, kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<Py<
 
     if let Some(k) = kwargs {
         for (key, value) in k.iter() {
-            let key_str: String = key.extract().map_err(|_| {
+            // 关键字名直接借用 Python 字符串的 UTF-8 内容, 不再为每个参数分配 String.
+            let key_obj = key.cast::<PyString>().map_err(|_| {
                 pyo3::exceptions::PyTypeError::new_err("field() keyword names must be strings")
             })?;
-            match key_str.as_str() {
+            let key_str = key_obj.to_str()?;
+            match key_str {
                 "tag" => {
                     let int_tag = value.extract::<i64>().map_err(|_| {
                         pyo3::exceptions::PyTypeError::new_err(
@@ -350,12 +416,12 @@ pub fn field(py: Python<'_>, kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<Py<
                     tag = Some(int_tag as u8);
                 }
                 "default" => {
-                    if !value.is(nodefault_ref) {
+                    if !is_nodefault(&value)? {
                         default_value = Some(value.unbind());
                     }
                 }
                 "default_factory" => {
-                    if !value.is(nodefault_ref) {
+                    if !is_nodefault(&value)? {
                         default_factory = Some(value.unbind());
                     }
                 }
@@ -419,10 +485,53 @@ pub const SCHEMA_ATTR: &str = "__tarsio_schema__";
 thread_local! {
     // 线程内 schema 缓存,用于减少高频 getattr 开销。
     // 使用 Weak 引用，避免循环引用导致的内存泄漏。
-    pub static SCHEMA_CACHE: RefCell<FxHashMap<usize, Weak<StructDef>>> = RefCell::new(FxHashMap::default());
+    pub static SCHEMA_CACHE: RefCell<FxHashMap<usize, SchemaCacheEntry>> = RefCell::new(FxHashMap::default());
+}
+
+/// 线程内 Schema 缓存条目.
+///
+/// 缓存以类对象地址为键, 类被回收后该地址可能被新类复用, 而 `StructDef` 仍可能被
+/// 外部持有的 `__tarsio_schema__` 保活. 因此同时保存类的弱引用, 命中时确认它仍指向
+/// 同一个类, 避免把已回收类的字段布局套用到新类上.
+pub struct SchemaCacheEntry {
+    cls: Py<PyWeakrefReference>,
+    def: Weak<StructDef>,
+}
+
+/// 登记类的 Schema 到线程内缓存; 类不支持弱引用时不缓存.
+pub(crate) fn cache_schema(cls: &Bound<'_, PyType>, def: &Arc<StructDef>) {
+    let cls_key = cls.as_ptr() as usize;
+    let entry = PyWeakrefReference::new(cls.as_any())
+        .ok()
+        .map(|weak| SchemaCacheEntry {
+            cls: weak.unbind(),
+            def: Arc::downgrade(def),
+        });
+    SCHEMA_CACHE.with(|cache| {
+        let mut cache = cache.borrow_mut();
+        match entry {
+            Some(entry) => cache.insert(cls_key, entry),
+            None => cache.remove(&cls_key),
+        };
+    });
+}
+
+/// 从线程内缓存读取类的 Schema; 类已被回收或地址被复用时返回 `None`.
+pub(crate) fn cached_schema(cls: &Bound<'_, PyType>) -> Option<Arc<StructDef>> {
+    let cls_key = cls.as_ptr() as usize;
+    SCHEMA_CACHE.with(|cache| {
+        let cache = cache.borrow();
+        let entry = cache.get(&cls_key)?;
+        let alive = entry
+            .cls
+            .bind(cls.py())
+            .upgrade()
+            .is_some_and(|obj| obj.as_ptr() == cls.as_ptr());
+        if alive { entry.def.upgrade() } else { None }
+    })
 }
 
-#[pyclass(module = "tarsio._core", name = "Schema")]
+#[pyclass(frozen, module = "tarsio._core", name = "Schema")]
 pub struct Schema {
     pub def: Arc<StructDef>,
 }
@@ -1,8 +1,14 @@
 //! Struct 泛型参数化辅助逻辑。
 
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::sync::PyOnceLock;
 use pyo3::types::{PyAny, PyDict, PyTuple, PyType};
 
+// 参数化路径上用到的标准库类型, 首次使用时导入一次, 之后直接复用.
+static TYPEVAR_CLS: PyOnceLock<Py<PyType>> = PyOnceLock::new();
+static GENERIC_ALIAS_CLS: PyOnceLock<Py<PyType>> = PyOnceLock::new();
+
 fn normalize_class_getitem_args<'py>(
     py: Python<'py>,
     params: &Bound<'py, PyAny>,
@@ -13,10 +19,11 @@ fn normalize_class_getitem_args<'py>(
     PyTuple::new(py, [params.clone().unbind()])
 }
 
-fn contains_unresolved_typevar(py: Python<'_>, item: &Bound<'_, PyAny>) -> PyResult<bool> {
-    let typing = py.import("typing")?;
-    let typevar_cls = typing.getattr("TypeVar")?;
-    if item.is_instance(&typevar_cls)? {
+fn contains_unresolved_typevar(
+    item: &Bound<'_, PyAny>,
+    typevar_cls: &Bound<'_, PyAny>,
+) -> PyResult<bool> {
+    if item.is_instance(typevar_cls)? {
         return Ok(true);
     }
 
@@ -34,9 +41,9 @@ fn get_generic_alias<'py>(
     cls: &Bound<'py, PyType>,
     args: &Bound<'py, PyTuple>,
 ) -> PyResult<Bound<'py, PyAny>> {
-    let types_mod = py.import("types")?;
-    let generic_alias = types_mod.getattr("GenericAlias")?;
-    generic_alias.call1((cls, args))
+    GENERIC_ALIAS_CLS
+        .import(py, "types", "GenericAlias")?
+        .call1((cls, args))
 }
 
 fn build_parametrized_struct_name(
@@ -93,31 +100,33 @@ pub(crate) fn handle_class_getitem<'py>(
         )));
     }
 
+    // 已参数化过的组合直接命中缓存. 含未绑定 TypeVar 的参数从不写入缓存,
+    // 因此命中即说明参数均已具体化, 可跳过下方的 TypeVar 检查.
+    let cache = cls
+        .getattr_opt(intern!(py, "__tarsio_generic_cache__"))?
+        .and_then(|obj| obj.cast_into::<PyDict>().ok());
+    if let Some(cache) = cache.as_ref()
+        && let Some(existing) = cache.get_item(&args)?
+    {
+        return Ok(existing);
+    }
+
+    let typevar_cls = TYPEVAR_CLS.import(py, "typing", "TypeVar")?.as_any();
     for item in args.iter() {
-        if contains_unresolved_typevar(py, &item)? {
+        if contains_unresolved_typevar(&item, typevar_cls)? {
             return get_generic_alias(py, cls, &args);
         }
     }
 
-    let cache_any = cls.getattr("__tarsio_generic_cache__").ok();
-    let cache = if let Some(obj) = cache_any {
-        if let Ok(dict) = obj.cast::<PyDict>() {
-            dict.clone()
-        } else {
+    let cache = match cache {
+        Some(cache) => cache,
+        None => {
             let d = PyDict::new(py);
             cls.setattr("__tarsio_generic_cache__", &d)?;
             d
         }
-    } else {
-        let d = PyDict::new(py);
-        cls.setattr("__tarsio_generic_cache__", &d)?;
-        d
     };
 
-    if let Some(existing) = cache.get_item(&args)? {
-        return Ok(existing);
-    }
-
     let name = build_parametrized_struct_name(py, cls, &args)?;
     let bases = PyTuple::new(py, [cls.clone().unbind()])?;
     let namespace = PyDict::new(py);
@@ -585,7 +585,7 @@ impl TarsDictType {
 ///     optional: 是否可选。
 ///     required: 是否必填。
 ///     constraints: 字段约束。
-#[pyclass(module = "tarsio._core.inspect", name = "Field")]
+#[pyclass(frozen, module = "tarsio._core.inspect", name = "Field")]
 pub struct Field {
     #[pyo3(get)]
     pub name: String,
@@ -612,7 +612,7 @@ pub type FieldInfo = Field;
 /// Attributes:
 ///     cls: 结构体类型。
 ///     fields: 字段列表，按 tag 升序。
-#[pyclass(module = "tarsio._core.inspect")]
+#[pyclass(frozen, module = "tarsio._core.inspect")]
 pub struct StructInfo {
     #[pyo3(get)]
     pub cls: Py<PyType>,
@@ -1,5 +1,6 @@
 //! Struct 实例构造辅助逻辑。
 
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyDict, PyString, PyTuple};
 use smallvec::SmallVec;
@@ -34,21 +35,16 @@ fn missing_required_argument_error(field: &FieldDef) -> PyErr {
     ))
 }
 
+/// 若实例定义了 `__post_init__` 则调用之.
+///
+/// 每次构造/解码都会走到这里, 属性名使用驻留字符串, 且以 `getattr_opt` 查找,
+/// 绝大多数未定义 `__post_init__` 的类不再为此构造并丢弃 AttributeError.
 pub(crate) fn run_post_init(self_obj: &Bound<'_, PyAny>) -> PyResult<()> {
     let py = self_obj.py();
-    match self_obj.getattr("__post_init__") {
-        Ok(post_init) => {
-            post_init.call0()?;
-            Ok(())
-        }
-        Err(err) => {
-            if err.is_instance_of::<pyo3::exceptions::PyAttributeError>(py) {
-                Ok(())
-            } else {
-                Err(err)
-            }
-        }
+    if let Some(post_init) = self_obj.getattr_opt(intern!(py, "__post_init__"))? {
+        post_init.call0()?;
     }
+    Ok(())
 }
 
 #[inline]
@@ -1,5 +1,6 @@
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyDict, PyModule, PyTuple, PyType};
+use pyo3::types::{PyAny, PyDict, PyModule, PyString, PyTuple, PyType};
 
 use crate::binding::compiler::compile_schema_from_class;
 use crate::binding::schema::SchemaConfig;
@@ -24,75 +25,65 @@ pub fn _tarsio_structmeta_new<'py>(
     let mut dict = false;
     let mut weakref = false;
 
-    if let Some(k) = kwargs {
-        if let Some(v) = k.get_item("frozen")? {
-            frozen = v.extract::<bool>()?;
-            k.del_item("frozen")?;
-        }
-        if let Some(v) = k.get_item("forbid_unknown_tags")? {
-            forbid_unknown_tags = v.extract::<bool>()?;
-            k.del_item("forbid_unknown_tags")?;
-        }
-        if let Some(v) = k.get_item("eq")? {
-            eq = v.extract::<bool>()?;
-            k.del_item("eq")?;
-        }
-        if let Some(v) = k.get_item("order")? {
-            order = v.extract::<bool>()?;
-            k.del_item("order")?;
-        }
-        if let Some(v) = k.get_item("omit_defaults")? {
-            omit_defaults = v.extract::<bool>()?;
-            k.del_item("omit_defaults")?;
-        }
-        if let Some(v) = k.get_item("repr_omit_defaults")? {
-            repr_omit_defaults = v.extract::<bool>()?;
-            k.del_item("repr_omit_defaults")?;
-        }
-        if let Some(v) = k.get_item("kw_only")? {
-            kw_only = v.extract::<bool>()?;
-            k.del_item("kw_only")?;
-        }
-        if let Some(v) = k.get_item("dict")? {
-            dict = v.extract::<bool>()?;
-            k.del_item("dict")?;
-        }
-        if let Some(v) = k.get_item("weakref")? {
-            weakref = v.extract::<bool>()?;
-            k.del_item("weakref")?;
+    // 绝大多数类定义不带配置关键字, 空 kwargs 直接跳过;
+    // 否则单次遍历按键名分派, 不再对每个配置项各做一次 get_item/del_item.
+    if let Some(k) = kwargs
+        && !k.is_empty()
+    {
+        for (key, value) in k.iter() {
+            let Ok(key_str) = key.cast::<PyString>() else {
+                continue;
+            };
+            let flag = match key_str.to_str()? {
+                "frozen" => &mut frozen,
+                "forbid_unknown_tags" => &mut forbid_unknown_tags,
+                "eq" => &mut eq,
+                "order" => &mut order,
+                "omit_defaults" => &mut omit_defaults,
+                "repr_omit_defaults" => &mut repr_omit_defaults,
+                "kw_only" => &mut kw_only,
+                "dict" => &mut dict,
+                "weakref" => &mut weakref,
+                _ => continue,
+            };
+            *flag = value.extract::<bool>()?;
         }
     }
 
-    let mut field_names: Vec<String> = Vec::new();
-    if let Some(ann_any) = namespace.get_item("__annotations__")?
+    // 直接保留注解字典中的键对象 (源码标识符, 已由解释器驻留),
+    // 后续默认值搬移与 __slots__ 都复用同一字符串对象, 不再经 String 往返重新创建.
+    // 命名空间中的固定键使用驻留字符串, 每次建类不再新建 Python 字符串.
+    let mut field_names: Vec<Bound<'py, PyString>> = Vec::new();
+    if let Some(ann_any) = namespace.get_item(intern!(py, "__annotations__"))?
         && let Ok(ann) = ann_any.cast::<PyDict>()
     {
+        field_names.reserve(ann.len());
         for k in ann.keys() {
-            let s = k.extract::<String>()?;
-            if s.starts_with("__") {
+            let name = k.cast_into::<PyString>()?;
+            if name.to_str()?.starts_with("__") {
                 continue;
             }
-            field_names.push(s);
+            field_names.push(name);
         }
     }
 
     if !field_names.is_empty() {
         let defaults = PyDict::new(py);
         for name in &field_names {
-            if let Some(v) = namespace.get_item(name.as_str())? {
-                namespace.del_item(name.as_str())?;
-                defaults.set_item(name.as_str(), v)?;
+            if let Some(v) = namespace.get_item(name)? {
+                namespace.del_item(name)?;
+                defaults.set_item(name, v)?;
             }
         }
         if !defaults.is_empty() {
-            namespace.set_item("__tarsio_defaults__", defaults)?;
+            namespace.set_item(intern!(py, "__tarsio_defaults__"), defaults)?;
         }
     }
 
-    if namespace.get_item("__slots__")?.is_none() && !field_names.is_empty() {
-        let mut slots: Vec<Py<PyAny>> = Vec::new();
+    if !field_names.is_empty() && namespace.get_item(intern!(py, "__slots__"))?.is_none() {
+        let mut slots: Vec<Py<PyAny>> = Vec::with_capacity(field_names.len() + 2);
         for name in &field_names {
-            slots.push(name.as_str().into_pyobject(py)?.into_any().unbind());
+            slots.push(name.clone().into_any().unbind());
         }
         if dict {
             slots.push("__dict__".into_pyobject(py)?.into_any().unbind());
@@ -101,11 +92,11 @@ pub fn _tarsio_structmeta_new<'py>(
             slots.push("__weakref__".into_pyobject(py)?.into_any().unbind());
         }
         let slots_tuple = PyTuple::new(py, slots)?;
-        namespace.set_item("__slots__", slots_tuple)?;
+        namespace.set_item(intern!(py, "__slots__"), slots_tuple)?;
     }
 
-    let builtins = py.import("builtins")?;
-    let type_obj = builtins.getattr("type")?;
+    // 直接取内置 `type` 类型对象, 每次创建类不再导入 builtins 再按名查找
+    let type_obj = py.get_type::<PyType>();
     let new_cls_any = type_obj.call_method("__new__", (mcls, name, bases, namespace), None)?;
     let new_cls = new_cls_any.cast::<PyType>()?.clone();
 
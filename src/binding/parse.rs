@@ -1,3 +1,4 @@
+use pyo3::ffi;
 use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyDict, PyModule, PyString, PyTuple, PyType};
@@ -40,6 +41,74 @@ pub enum TypeInfoIR {
     TarsDict,
 }
 
+impl TypeInfoIR {
+    /// 结构相同判定, 其中的 Python 类对象按身份比较.
+    ///
+    /// 用于 Literal/Enum 变体去重, 不必为每个变体格式化 Debug 字符串.
+    fn is_same(&self, other: &TypeInfoIR) -> bool {
+        let all_same = |a: &[TypeInfoIR], b: &[TypeInfoIR]| {
+            a.len() == b.len() && a.iter().zip(b).all(|(x, y)| x.is_same(y))
+        };
+        match (self, other) {
+            (TypeInfoIR::Int, TypeInfoIR::Int)
+            | (TypeInfoIR::Str, TypeInfoIR::Str)
+            | (TypeInfoIR::Float, TypeInfoIR::Float)
+            | (TypeInfoIR::Bool, TypeInfoIR::Bool)
+            | (TypeInfoIR::Bytes, TypeInfoIR::Bytes)
+            | (TypeInfoIR::Any, TypeInfoIR::Any)
+            | (TypeInfoIR::NoneType, TypeInfoIR::NoneType)
+            | (TypeInfoIR::TypedDict, TypeInfoIR::TypedDict)
+            | (TypeInfoIR::TarsDict, TypeInfoIR::TarsDict) => true,
+            (TypeInfoIR::NamedTuple(c1, a), TypeInfoIR::NamedTuple(c2, b)) => {
+                c1.as_ptr() == c2.as_ptr() && all_same(a, b)
+            }
+            (TypeInfoIR::Dataclass(c1), TypeInfoIR::Dataclass(c2))
+            | (TypeInfoIR::Struct(c1), TypeInfoIR::Struct(c2)) => c1.as_ptr() == c2.as_ptr(),
+            (TypeInfoIR::Enum(c1, a), TypeInfoIR::Enum(c2, b)) => {
+                c1.as_ptr() == c2.as_ptr() && a.is_same(b)
+            }
+            (TypeInfoIR::Set(a), TypeInfoIR::Set(b))
+            | (TypeInfoIR::List(a), TypeInfoIR::List(b))
+            | (TypeInfoIR::VarTuple(a), TypeInfoIR::VarTuple(b))
+            | (TypeInfoIR::Optional(a), TypeInfoIR::Optional(b)) => a.is_same(b),
+            (TypeInfoIR::Union(a), TypeInfoIR::Union(b))
+            | (TypeInfoIR::Tuple(a), TypeInfoIR::Tuple(b)) => all_same(a, b),
+            (TypeInfoIR::Map(k1, v1), TypeInfoIR::Map(k2, v2)) => k1.is_same(k2) && v1.is_same(v2),
+            _ => false,
+        }
+    }
+
+    /// 深拷贝类型 IR, 其中的 Python 类对象仅增加引用计数.
+    fn clone_ref(&self, py: Python<'_>) -> Self {
+        let boxed = |inner: &TypeInfoIR| Box::new(inner.clone_ref(py));
+        let items = |items: &[TypeInfoIR]| items.iter().map(|t| t.clone_ref(py)).collect();
+        match self {
+            TypeInfoIR::Int => TypeInfoIR::Int,
+            TypeInfoIR::Str => TypeInfoIR::Str,
+            TypeInfoIR::Float => TypeInfoIR::Float,
+            TypeInfoIR::Bool => TypeInfoIR::Bool,
+            TypeInfoIR::Bytes => TypeInfoIR::Bytes,
+            TypeInfoIR::Any => TypeInfoIR::Any,
+            TypeInfoIR::NoneType => TypeInfoIR::NoneType,
+            TypeInfoIR::TypedDict => TypeInfoIR::TypedDict,
+            TypeInfoIR::TarsDict => TypeInfoIR::TarsDict,
+            TypeInfoIR::NamedTuple(cls, inner) => {
+                TypeInfoIR::NamedTuple(cls.clone_ref(py), items(inner))
+            }
+            TypeInfoIR::Dataclass(cls) => TypeInfoIR::Dataclass(cls.clone_ref(py)),
+            TypeInfoIR::Set(inner) => TypeInfoIR::Set(boxed(inner)),
+            TypeInfoIR::Enum(cls, inner) => TypeInfoIR::Enum(cls.clone_ref(py), boxed(inner)),
+            TypeInfoIR::Union(inner) => TypeInfoIR::Union(items(inner)),
+            TypeInfoIR::List(inner) => TypeInfoIR::List(boxed(inner)),
+            TypeInfoIR::Tuple(inner) => TypeInfoIR::Tuple(items(inner)),
+            TypeInfoIR::VarTuple(inner) => TypeInfoIR::VarTuple(boxed(inner)),
+            TypeInfoIR::Map(k, v) => TypeInfoIR::Map(boxed(k), boxed(v)),
+            TypeInfoIR::Optional(inner) => TypeInfoIR::Optional(boxed(inner)),
+            TypeInfoIR::Struct(cls) => TypeInfoIR::Struct(cls.clone_ref(py)),
+        }
+    }
+}
+
 #[derive(Debug)]
 pub struct FieldInfoIR {
     pub name: String,
@@ -66,8 +135,10 @@ struct DefaultSpecIR {
 
 struct IntrospectionContext<'py> {
     typing: Bound<'py, PyModule>,
-    builtins: Bound<'py, PyModule>,
-    types_mod: Bound<'py, PyModule>,
+    get_origin: Bound<'py, PyAny>,
+    get_args: Bound<'py, PyAny>,
+    member_descriptor: Bound<'py, PyAny>,
+    getset_descriptor: Bound<'py, PyAny>,
     typing_is_typeddict: Option<Bound<'py, PyAny>>,
     dataclasses_is_dataclass: Option<Bound<'py, PyAny>>,
     annotated: Bound<'py, PyAny>,
@@ -101,7 +172,7 @@ struct IntrospectionContext<'py> {
     mapping_cls: Bound<'py, PyAny>,
     mutable_mapping_cls: Bound<'py, PyAny>,
     union_type: Option<Bound<'py, PyAny>>,
-    enum_base: Bound<'py, PyAny>,
+    enum_base: Bound<'py, PyType>,
 }
 
 impl<'py> IntrospectionContext<'py> {
@@ -114,6 +185,8 @@ impl<'py> IntrospectionContext<'py> {
         let typing_extensions = py.import("typing_extensions").ok();
         let dataclasses = py.import("dataclasses").ok();
 
+        let get_origin = typing.getattr("get_origin")?;
+        let get_args = typing.getattr("get_args")?;
         let annotated = typing.getattr("Annotated")?;
         let union_origin = typing.getattr("Union")?;
         let forward_ref = typing.getattr("ForwardRef")?;
@@ -174,11 +247,15 @@ impl<'py> IntrospectionContext<'py> {
         let mutable_mapping_cls = collections_abc.getattr("MutableMapping")?;
 
         let union_type = types_mod.getattr("UnionType").ok();
-        let enum_base = enum_mod.getattr("Enum")?;
+        let member_descriptor = types_mod.getattr("MemberDescriptorType")?;
+        let getset_descriptor = types_mod.getattr("GetSetDescriptorType")?;
+        let enum_base = enum_mod.getattr("Enum")?.cast_into::<PyType>()?;
         Ok(Self {
             typing,
-            builtins,
-            types_mod,
+            get_origin,
+            get_args,
+            member_descriptor,
+            getset_descriptor,
             typing_is_typeddict,
             dataclasses_is_dataclass,
             annotated,
@@ -221,11 +298,11 @@ pub fn introspect_struct_fields<'py>(
     py: Python<'py>,
     cls: &Bound<'py, PyType>,
 ) -> PyResult<Option<Vec<FieldInfoIR>>> {
-    let ctx = IntrospectionContext::new(py)?;
-    if !detect_struct_kind_with_ctx(py, cls, &ctx)? {
+    if !detect_struct_kind(py, cls)? {
         return Ok(None);
     }
 
+    let ctx = IntrospectionContext::new(py)?;
     introspect_tars_struct_fields(py, cls, &ctx)
 }
 
@@ -242,9 +319,9 @@ fn introspect_type_info_ir_with_ctx<'py>(
     tp: &Bound<'py, PyAny>,
     ctx: &IntrospectionContext<'py>,
 ) -> PyResult<(TypeInfoIR, Option<ConstraintsIR>)> {
-    let origin = ctx.typing.call_method1("get_origin", (tp,))?;
+    let origin = ctx.get_origin.call1((tp,))?;
     if !origin.is_none() && origin.is(&ctx.annotated) {
-        let args_any = ctx.typing.call_method1("get_args", (tp,))?;
+        let args_any = ctx.get_args.call1((tp,))?;
         let args = args_any.cast::<PyTuple>()?;
         let (real_type, _tag, constraints) = parse_annotated_args_loose("_", args)?;
         let typevar_map = HashMap::new();
@@ -377,31 +454,15 @@ fn get_type_hints_with_fallback<'py>(
     Ok(hints)
 }
 
+/// 判断类是否为 Struct 子类.
+///
+/// 只依赖 `_StructBase` 的类型检查, 不构造 `IntrospectionContext`,
+/// 避免在 Schema 缓存未命中的路径上重复导入 typing/collections.abc 等模块.
 #[inline(always)]
-pub fn detect_struct_kind<'py>(py: Python<'py>, cls: &Bound<'py, PyType>) -> PyResult<bool> {
-    let ctx = IntrospectionContext::new(py)?;
-    detect_struct_kind_with_ctx(py, cls, &ctx)
-}
-
-#[inline(always)]
-fn detect_struct_kind_with_ctx<'py>(
-    _py: Python<'py>,
-    cls: &Bound<'py, PyType>,
-    _ctx: &IntrospectionContext<'py>,
-) -> PyResult<bool> {
+pub fn detect_struct_kind<'py>(_py: Python<'py>, cls: &Bound<'py, PyType>) -> PyResult<bool> {
     cls.is_subclass_of::<Struct>()
 }
 
-#[inline(always)]
-fn is_subclass<'py>(
-    cls: &Bound<'py, PyType>,
-    base: &Bound<'py, PyAny>,
-    ctx: &IntrospectionContext<'py>,
-) -> PyResult<bool> {
-    let issubclass = ctx.builtins.getattr("issubclass")?;
-    issubclass.call1((cls, base))?.is_truthy()
-}
-
 fn is_instance_of_any<'py>(
     value: &Bound<'py, PyAny>,
     candidates: &[Bound<'py, PyAny>],
@@ -442,24 +503,30 @@ fn introspect_tars_struct_fields<'py>(
         constraints: Option<ConstraintsIR>,
     }
 
+    let default_sources = collect_default_sources(py, cls)?;
     let mut pending: Vec<PendingField> = Vec::new();
+    // 同一个类内按注解对象身份记忆翻译结果: `Optional[int]`、`List[T]` 等 typing 形式
+    // 与类型别名会在多个字段间复用同一对象, 命中后只需深拷贝 IR.
+    // 只按身份而非相等性命中, 因为 `int | str == str | int` 但变体顺序影响编码.
+    let mut translated: HashMap<usize, (TypeInfoIR, bool)> = HashMap::new();
     for (name_obj, type_hint) in hints.iter() {
         let name: String = name_obj.extract()?;
         if name.starts_with("__") {
             continue;
         }
 
-        let origin = ctx.typing.call_method1("get_origin", (&type_hint,))?;
+        let origin = ctx.get_origin.call1((&type_hint,))?;
         let (resolved_type, annotated_tag, constraints) =
             if !origin.is_none() && origin.is(&ctx.annotated) {
-                let args_any = ctx.typing.call_method1("get_args", (&type_hint,))?;
+                let args_any = ctx.get_args.call1((&type_hint,))?;
                 let args = args_any.cast::<PyTuple>()?;
                 parse_annotated_args_loose(name.as_str(), args)?
             } else {
                 (type_hint.clone(), None, None)
             };
 
-        let default_spec = lookup_default_value(py, cls, name.as_str(), ctx)?;
+        let default_spec =
+            lookup_default_value(py, &default_sources, &name_obj, name.as_str(), ctx)?;
         if annotated_tag.is_some() && default_spec.explicit_tag.is_some() {
             return Err(pyo3::exceptions::PyTypeError::new_err(format!(
                 "Field '{}' cannot mix Annotated integer tag with field(tag=...)",
@@ -468,7 +535,16 @@ fn introspect_tars_struct_fields<'py>(
         }
         let explicit_tag = default_spec.explicit_tag.or(annotated_tag);
 
-        let (typ, is_optional) = translate_type_info_ir(py, &resolved_type, &typevar_map, ctx)?;
+        let key = resolved_type.as_ptr() as usize;
+        let (typ, is_optional) = match translated.get(&key) {
+            Some((typ, is_optional)) => (typ.clone_ref(py), *is_optional),
+            None => {
+                let (typ, is_optional) =
+                    translate_type_info_ir(py, &resolved_type, &typevar_map, ctx)?;
+                translated.insert(key, (typ.clone_ref(py), is_optional));
+                (typ, is_optional)
+            }
+        };
         let is_required = !is_optional && !default_spec.has_default;
 
         pending.push(PendingField {
@@ -617,6 +693,26 @@ fn parse_annotated_payload<'py>(
     Ok((real_type, found_int_tag, None))
 }
 
+#[inline]
+fn builtin_scalar_type_info<'py>(
+    resolved: &Bound<'py, PyAny>,
+    ctx: &IntrospectionContext<'py>,
+) -> Option<TypeInfoIR> {
+    if resolved.is(&ctx.builtin_int) {
+        Some(TypeInfoIR::Int)
+    } else if resolved.is(&ctx.builtin_str) {
+        Some(TypeInfoIR::Str)
+    } else if resolved.is(&ctx.builtin_float) {
+        Some(TypeInfoIR::Float)
+    } else if resolved.is(&ctx.builtin_bool) {
+        Some(TypeInfoIR::Bool)
+    } else if resolved.is(&ctx.builtin_bytes) {
+        Some(TypeInfoIR::Bytes)
+    } else {
+        None
+    }
+}
+
 fn translate_type_info_ir<'py>(
     py: Python<'py>,
     tp: &Bound<'py, PyAny>,
@@ -625,6 +721,12 @@ fn translate_type_info_ir<'py>(
 ) -> PyResult<(TypeInfoIR, bool)> {
     let mut resolved = resolve_typevar(py, tp, typevar_map, ctx)?;
 
+    // 绝大多数字段注解是裸的内置标量类型, 直接按身份命中,
+    // 跳过 `__supertype__` 探测、别名判定与 get_origin 调用.
+    if let Some(typ) = builtin_scalar_type_info(&resolved, ctx) {
+        return Ok((typ, false));
+    }
+
     if resolved.is_instance_of::<PyString>() {
         let s: String = resolved.extract()?;
         return Err(pyo3::exceptions::PyTypeError::new_err(format!(
@@ -646,7 +748,9 @@ fn translate_type_info_ir<'py>(
     let mut forced_optional = false;
 
     loop {
-        if let Ok(super_type) = resolved.getattr("__supertype__") {
+        // 绝大多数注解没有 `__supertype__`, 以 getattr_opt 探测,
+        // 不再逐层构造并丢弃 AttributeError.
+        if let Ok(Some(super_type)) = resolved.getattr_opt(intern!(py, "__supertype__")) {
             resolved = super_type;
             continue;
         }
@@ -661,13 +765,13 @@ fn translate_type_info_ir<'py>(
             ));
         }
 
-        let origin = ctx.typing.call_method1("get_origin", (&resolved,))?;
+        let origin = ctx.get_origin.call1((&resolved,))?;
         if origin.is_none() {
             break;
         }
 
         if origin.is(&ctx.annotated) {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             let (real_type, _tag, _constraints) = parse_annotated_args_loose("_", args)?;
             resolved = real_type;
@@ -677,7 +781,7 @@ fn translate_type_info_ir<'py>(
         if let Some(final_cls) = ctx.final_cls.as_ref()
             && origin.is(final_cls)
         {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.is_empty() {
                 return Err(pyo3::exceptions::PyTypeError::new_err(
@@ -691,7 +795,7 @@ fn translate_type_info_ir<'py>(
         if let Some(type_alias) = ctx.type_alias.as_ref()
             && origin.is(type_alias)
         {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.is_empty() {
                 return Err(pyo3::exceptions::PyTypeError::new_err(
@@ -703,7 +807,7 @@ fn translate_type_info_ir<'py>(
         }
 
         if is_identity_of_any(&origin, &ctx.type_alias_types) {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.is_empty() {
                 return Err(pyo3::exceptions::PyTypeError::new_err(
@@ -717,7 +821,7 @@ fn translate_type_info_ir<'py>(
         if let Some(required_cls) = ctx.required_cls.as_ref()
             && origin.is(required_cls)
         {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.is_empty() {
                 return Err(pyo3::exceptions::PyTypeError::new_err(
@@ -731,7 +835,7 @@ fn translate_type_info_ir<'py>(
         if let Some(not_required_cls) = ctx.not_required_cls.as_ref()
             && origin.is(not_required_cls)
         {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.is_empty() {
                 return Err(pyo3::exceptions::PyTypeError::new_err(
@@ -744,7 +848,7 @@ fn translate_type_info_ir<'py>(
         }
 
         if origin.is(&ctx.literal_cls) {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.is_empty() {
                 return Err(pyo3::exceptions::PyTypeError::new_err(
@@ -752,8 +856,8 @@ fn translate_type_info_ir<'py>(
                 ));
             }
 
-            let mut variants = Vec::new();
-            let mut seen = HashSet::new();
+            let mut variants: Vec<TypeInfoIR> = Vec::new();
+            let mut seen_types = HashSet::new();
             let mut has_none = false;
 
             for val in args.iter() {
@@ -762,9 +866,12 @@ fn translate_type_info_ir<'py>(
                     continue;
                 }
                 let val_type = val.get_type();
+                // 同一值类型只翻译一次, 重复出现时不再递归翻译并格式化去重键
+                if !seen_types.insert(val_type.as_ptr() as usize) {
+                    continue;
+                }
                 let (typ, _opt) = translate_type_info_ir(py, val_type.as_any(), typevar_map, ctx)?;
-                let key = format!("{:?}", typ);
-                if seen.insert(key) {
+                if !variants.iter().any(|v| v.is_same(&typ)) {
                     variants.push(typ);
                 }
             }
@@ -784,7 +891,7 @@ fn translate_type_info_ir<'py>(
         let is_union =
             origin.is(&ctx.union_origin) || ctx.union_type.as_ref().is_some_and(|u| origin.is(u));
         if is_union {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             let mut variants = Vec::new();
             let mut has_none = false;
@@ -809,7 +916,7 @@ fn translate_type_info_ir<'py>(
             || origin.is(&ctx.sequence_cls)
             || origin.is(&ctx.mutable_sequence_cls)
         {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.is_empty() {
                 let repr: String = resolved.repr()?.extract()?;
@@ -827,7 +934,7 @@ fn translate_type_info_ir<'py>(
             || origin.is(&ctx.builtin_set)
             || origin.is(&ctx.builtin_frozenset)
         {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.is_empty() {
                 let repr: String = resolved.repr()?.extract()?;
@@ -841,7 +948,7 @@ fn translate_type_info_ir<'py>(
         }
 
         if origin.is(&ctx.mapping_cls) || origin.is(&ctx.mutable_mapping_cls) {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.len() < 2 {
                 let repr: String = resolved.repr()?.extract()?;
@@ -856,7 +963,7 @@ fn translate_type_info_ir<'py>(
         }
 
         if origin.is(&ctx.builtin_list) || origin.is(&ctx.builtin_tuple) {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.is_empty() {
                 let repr: String = resolved.repr()?.extract()?;
@@ -892,7 +999,7 @@ fn translate_type_info_ir<'py>(
         }
 
         if origin.is(&ctx.builtin_dict) {
-            let args_any = ctx.typing.call_method1("get_args", (&resolved,))?;
+            let args_any = ctx.get_args.call1((&resolved,))?;
             let args = args_any.cast::<PyTuple>()?;
             if args.len() < 2 {
                 let repr: String = resolved.repr()?.extract()?;
@@ -917,23 +1024,19 @@ fn translate_type_info_ir<'py>(
         return Ok((TypeInfoIR::NoneType, true));
     }
 
-    if resolved.is(&ctx.builtin_int) {
-        return Ok((TypeInfoIR::Int, forced_optional));
-    }
-    if resolved.is(&ctx.builtin_str) {
-        return Ok((TypeInfoIR::Str, forced_optional));
-    }
-    if resolved.is(&ctx.builtin_float) {
-        return Ok((TypeInfoIR::Float, forced_optional));
-    }
-    if resolved.is(&ctx.builtin_bool) {
-        return Ok((TypeInfoIR::Bool, forced_optional));
-    }
-    if resolved.is(&ctx.builtin_bytes) {
-        return Ok((TypeInfoIR::Bytes, forced_optional));
+    if let Some(typ) = builtin_scalar_type_info(&resolved, ctx) {
+        return Ok((typ, forced_optional));
     }
 
     if let Ok(resolved_type) = resolved.clone().cast_into::<PyType>() {
+        // 嵌套 Struct 是最常见的类注解, 先于 NamedTuple/TypedDict/dataclass
+        // 这些需要调用 Python 函数的判定处理.
+        if is_subtype(&resolved_type, &py.get_type::<Struct>()) {
+            return Ok((TypeInfoIR::Struct(resolved_type.unbind()), forced_optional));
+        }
+        if is_subtype(&resolved_type, &py.get_type::<TarsDict>()) {
+            return Ok((TypeInfoIR::TarsDict, forced_optional));
+        }
         if is_namedtuple_type(&resolved_type, ctx)? {
             let items = build_namedtuple_items(py, &resolved_type, typevar_map, ctx)?;
             return Ok((
@@ -953,21 +1056,24 @@ fn translate_type_info_ir<'py>(
     }
 
     if let Ok(resolved_type) = resolved.clone().cast_into::<PyType>()
-        && is_subclass(&resolved_type, &ctx.enum_base, ctx)?
+        && is_subtype(&resolved_type, &ctx.enum_base)
     {
         let members_any = resolved_type.getattr("__members__")?;
         let values_any = members_any.call_method0("values")?;
-        let mut variants = Vec::new();
-        let mut seen = HashSet::new();
+        let mut variants: Vec<TypeInfoIR> = Vec::new();
+        let mut seen_types = HashSet::new();
         let mut has_member = false;
         for member in values_any.try_iter()? {
             let member = member?;
             has_member = true;
             let value = member.getattr("value")?;
             let value_type = value.get_type();
+            // 成员值通常同属一种类型, 按类型对象身份跳过重复翻译
+            if !seen_types.insert(value_type.as_ptr() as usize) {
+                continue;
+            }
             let (typ, _opt) = translate_type_info_ir(py, value_type.as_any(), typevar_map, ctx)?;
-            let key = format!("{:?}", typ);
-            if seen.insert(key) {
+            if !variants.iter().any(|v| v.is_same(&typ)) {
                 variants.push(typ);
             }
         }
@@ -987,18 +1093,6 @@ fn translate_type_info_ir<'py>(
         ));
     }
 
-    if let Ok(resolved_type) = resolved.clone().cast_into::<PyType>()
-        && resolved_type.is_subclass_of::<Struct>()?
-    {
-        return Ok((TypeInfoIR::Struct(resolved_type.unbind()), forced_optional));
-    }
-
-    if let Ok(resolved_type) = resolved.clone().cast_into::<PyType>()
-        && resolved_type.is_subclass_of::<TarsDict>()?
-    {
-        return Ok((TypeInfoIR::TarsDict, forced_optional));
-    }
-
     let repr: String = resolved.repr()?.extract()?;
     Err(pyo3::exceptions::PyTypeError::new_err(format!(
         "Unsupported Tars type: {}",
@@ -1006,6 +1100,16 @@ fn translate_type_info_ir<'py>(
     )))
 }
 
+/// 按 MRO 判断子类关系.
+///
+/// `Enum` 与 `Struct` 的元类不是 `type` 本身, `issubclass` 会先查找并调用元类的
+/// `__subclasscheck__`. 这些基类不接受虚拟子类注册, 直接比较 MRO 结果一致.
+#[inline]
+fn is_subtype(cls: &Bound<'_, PyType>, base: &Bound<'_, PyType>) -> bool {
+    // SAFETY: 两个指针均来自当前持有引用的类型对象, `PyType_IsSubtype` 不会失败.
+    unsafe { ffi::PyType_IsSubtype(cls.as_type_ptr(), base.as_type_ptr()) != 0 }
+}
+
 fn is_typeddict_type<'py>(
     cls: &Bound<'py, PyType>,
     ctx: &IntrospectionContext<'py>,
@@ -1025,7 +1129,7 @@ fn is_namedtuple_type<'py>(
     cls: &Bound<'py, PyType>,
     ctx: &IntrospectionContext<'py>,
 ) -> PyResult<bool> {
-    if !is_subclass(cls, &ctx.builtin_tuple, ctx)? {
+    if !cls.is_subclass(&ctx.builtin_tuple)? {
         return Ok(false);
     }
     let fields_any = match cls.getattr("_fields") {
@@ -1109,31 +1213,48 @@ fn resolve_typevar_fallback<'py>(
     Ok(ctx.any_type.clone())
 }
 
-fn lookup_default_value<'py>(
+/// MRO 上每一层的默认值来源: (`__tarsio_defaults__`, 类 `__dict__`).
+type DefaultSources<'py> = Vec<(Option<Bound<'py, PyDict>>, Option<Bound<'py, PyDict>>)>;
+
+/// 按 MRO 收集默认值来源, 每个类只收集一次, 供所有字段复用.
+fn collect_default_sources<'py>(
     py: Python<'py>,
     cls: &Bound<'py, PyType>,
-    field_name: &str,
-    ctx: &IntrospectionContext<'py>,
-) -> PyResult<DefaultSpecIR> {
-    let member_descriptor = ctx.types_mod.getattr("MemberDescriptorType")?;
-    let getset_descriptor = ctx.types_mod.getattr("GetSetDescriptorType")?;
-
+) -> PyResult<DefaultSources<'py>> {
     let mro_any = cls.getattr(intern!(py, "__mro__"))?;
     let mro = mro_any.cast::<PyTuple>()?;
 
+    let mut sources = Vec::with_capacity(mro.len());
     for base in mro.iter() {
-        if let Ok(defaults_any) = base.getattr(intern!(py, "__tarsio_defaults__"))
-            && let Ok(defaults) = defaults_any.cast::<PyDict>()
-            && let Some(v) = defaults.get_item(field_name)?
+        let defaults = base
+            .getattr_opt(intern!(py, "__tarsio_defaults__"))?
+            .and_then(|v| v.cast_into::<PyDict>().ok());
+        let base_dict = base
+            .getattr_opt(intern!(py, "__dict__"))?
+            .and_then(|v| v.cast_into::<PyDict>().ok());
+        sources.push((defaults, base_dict));
+    }
+    Ok(sources)
+}
+
+fn lookup_default_value<'py>(
+    py: Python<'py>,
+    sources: &DefaultSources<'py>,
+    name_obj: &Bound<'py, PyAny>,
+    field_name: &str,
+    ctx: &IntrospectionContext<'py>,
+) -> PyResult<DefaultSpecIR> {
+    for (defaults, base_dict) in sources {
+        if let Some(defaults) = defaults
+            && let Some(v) = defaults.get_item(name_obj)?
         {
             return normalize_default_spec(py, &v, field_name, ctx);
         }
 
-        if let Ok(base_dict_any) = base.getattr(intern!(py, "__dict__"))
-            && let Ok(base_dict) = base_dict_any.cast::<PyDict>()
-            && let Some(v) = base_dict.get_item(field_name)?
+        if let Some(base_dict) = base_dict
+            && let Some(v) = base_dict.get_item(name_obj)?
         {
-            if v.is_instance(&member_descriptor)? || v.is_instance(&getset_descriptor)? {
+            if v.is_instance(&ctx.member_descriptor)? || v.is_instance(&ctx.getset_descriptor)? {
                 continue;
             }
             return normalize_default_spec(py, &v, field_name, ctx);
@@ -1,4 +1,5 @@
 use pyo3::ffi;
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::pyclass::CompareOp;
 use pyo3::types::{PyAny, PyDict, PyTuple, PyType};
@@ -12,22 +13,28 @@ use crate::binding::generics::handle_class_getitem;
 use crate::binding::instantiate::construct_instance;
 use crate::binding::parse::detect_struct_kind;
 
+/// 读取类上已编译的 Schema.
+///
+/// Schema 在类创建时即已编译并登记到线程内缓存, `__init__`/`__setattr__`/`__repr__`
+/// 等逐实例路径优先查缓存, 命中时不再经由 `getattr` + 提取访问类属性.
+/// 缓存条目同时核对类的弱引用, 地址被新类复用时视为未命中.
+/// 未命中 (其他线程创建的类, 或类/Schema 已失效) 时回退到类属性并刷新缓存.
 pub(crate) fn schema_from_class(
     py: Python<'_>,
     cls: &Bound<'_, PyType>,
 ) -> PyResult<Option<Arc<StructDef>>> {
-    if let Ok(schema_attr) = cls.getattr(SCHEMA_ATTR)
-        && let Ok(schema) = schema_attr.extract::<Py<Schema>>()
-    {
-        return Ok(Some(schema.borrow(py).def.clone()));
+    if let Some(def) = cached_schema(cls) {
+        return Ok(Some(def));
     }
 
-    let cls_key = cls.as_ptr() as usize;
-    let cached =
-        SCHEMA_CACHE.with(|cache| cache.borrow().get(&cls_key).and_then(|weak| weak.upgrade()));
-
-    if cached.is_some() {
-        return Ok(cached);
+    // 未注册 Schema 的类同样会走到这里, 以 getattr_opt 探测, 不构造 AttributeError;
+    // 属性名使用驻留字符串, 不必每次新建.
+    if let Ok(Some(schema_attr)) = cls.getattr_opt(intern!(py, SCHEMA_ATTR))
+        && let Ok(schema) = schema_attr.extract::<Py<Schema>>()
+    {
+        let def = schema.get().def.clone();
+        cache_schema(cls, &def);
+        return Ok(Some(def));
     }
 
     Ok(None)
@@ -37,12 +44,7 @@ pub fn ensure_schema_for_class(
     py: Python<'_>,
     cls: &Bound<'_, PyType>,
 ) -> PyResult<Arc<StructDef>> {
-    let cls_key = cls.as_ptr() as usize;
-
     if let Some(def) = schema_from_class(py, cls)? {
-        SCHEMA_CACHE.with(|cache| {
-            cache.borrow_mut().insert(cls_key, Arc::downgrade(&def));
-        });
         return Ok(def);
     }
 
@@ -157,18 +159,21 @@ impl Struct {
     /// 将 Tars 二进制数据解码为当前类的实例.
     ///
     /// Args:
-    ///     data: 待解码的 bytes.
+    ///     data: 待解码的 bytes-like 对象, bytes 及基于 bytes 的 memoryview 直接借用, 其余先拷贝.
     ///
     /// Returns:
     ///     解码得到的实例.
     ///
     /// Raises:
-    ///     TypeError: 目标类未注册 Schema.
+    ///     TypeError: 目标类未注册 Schema, 或 data 不是 bytes-like 对象.
     ///     ValueError: 数据格式不正确、缺少必填字段、或递归深度超过限制.
     #[classmethod]
-    fn decode<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+    fn decode<'py>(
+        cls: &Bound<'py, PyType>,
+        data: &Bound<'py, PyAny>,
+    ) -> PyResult<Bound<'py, PyAny>> {
         let py = cls.py();
-        crate::binding::codec::de::decode_object(py, cls, data)
+        crate::binding::codec::de::decode(py, cls, data)
     }
 
     #[classmethod]
@@ -200,9 +205,9 @@ impl Struct {
         };
 
         for field in &def.fields_sorted {
-            let val = match slf.getattr(field.name_py.bind(py)) {
-                Ok(v) => v,
-                Err(_) => {
+            let val = match slf.getattr_opt(field.name_py.bind(py)) {
+                Ok(Some(v)) => v,
+                _ => {
                     if let Some(default_value) = field.default_value.as_ref() {
                         default_value.bind(py).clone()
                     } else if let Some(factory) = field.default_factory.as_ref() {
@@ -261,11 +266,20 @@ impl Struct {
             Bound::from_owned_ptr(py, obj_ptr)
         };
 
+        // 单次遍历字段: 被替换的字段直接取 changes 中的值, 不再先读旧值再覆盖.
         let kwargs = PyDict::new(py);
+        let mut matched = 0usize;
         for field in &def.fields_sorted {
-            let val = match slf.getattr(field.name_py.bind(py)) {
-                Ok(v) => v,
-                Err(_) => {
+            if let Some(items) = changes
+                && let Some(value) = items.get_item(field.name_py.bind(py))?
+            {
+                matched += 1;
+                kwargs.set_item(field.name_py.bind(py), value)?;
+                continue;
+            }
+            let val = match slf.getattr_opt(field.name_py.bind(py)) {
+                Ok(Some(v)) => v,
+                _ => {
                     if let Some(default_value) = field.default_value.as_ref() {
                         default_value.bind(py).clone()
                     } else if let Some(factory) = field.default_factory.as_ref() {
@@ -285,7 +299,10 @@ impl Struct {
             kwargs.set_item(field.name_py.bind(py), val)?;
         }
 
-        if let Some(items) = changes {
+        // 存在非字段名的键时原样并入, 交由 construct_instance 报告未知参数.
+        if let Some(items) = changes
+            && matched != items.len()
+        {
             for (key, value) in items.iter() {
                 kwargs.set_item(key, value)?;
             }
@@ -311,15 +328,12 @@ impl Struct {
         result.push('(');
         let mut first = true;
         for field in &def.fields_sorted {
-            let val = match slf.getattr(field.name_py.bind(py)) {
-                Ok(v) => v,
-                Err(_) => continue, // Skip missing fields
+            let val = match slf.getattr_opt(field.name_py.bind(py)) {
+                Ok(Some(v)) => v,
+                _ => continue, // Skip missing fields
             };
 
-            if def.repr_omit_defaults
-                && let Some(default_val) = &field.default_value
-                && val.eq(default_val.bind(py))?
-            {
+            if def.repr_omit_defaults && field.equals_default(&val)? {
                 continue;
             }
 
@@ -348,15 +362,12 @@ impl Struct {
 
         let mut items = Vec::with_capacity(def.fields_sorted.len());
         for field in &def.fields_sorted {
-            let val = match slf.getattr(field.name_py.bind(py)) {
-                Ok(v) => v,
-                Err(_) => continue,
+            let val = match slf.getattr_opt(field.name_py.bind(py)) {
+                Ok(Some(v)) => v,
+                _ => continue,
             };
 
-            if def.repr_omit_defaults
-                && let Some(default_val) = &field.default_value
-                && val.eq(default_val.bind(py))?
-            {
+            if def.repr_omit_defaults && field.equals_default(&val)? {
                 continue;
             }
             items.push((field.name.clone(), val.unbind()));
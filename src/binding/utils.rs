@@ -1,9 +1,11 @@
 use std::cell::RefCell;
 
+use pyo3::buffer::PyBuffer;
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::ffi;
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyBytes, PyDict, PyType};
+use pyo3::types::{PyAny, PyBytes, PyDict, PyMemoryView, PyType};
 
 thread_local! {
     static STDLIB_CACHE: RefCell<Option<StdlibCache>> = const { RefCell::new(None) };
@@ -65,6 +67,86 @@ pub(crate) fn try_coerce_buffer_to_bytes<'py>(
     })
 }
 
+/// 以只读切片形式访问 bytes-like 对象的内容, 非 bytes-like 时返回 `None`.
+///
+/// bytes 与 C 连续的单字节 buffer(bytearray、memoryview、mmap 等)直接借用底层内存,
+/// 其余 buffer(非连续视图、多字节元素数组)回退到 `bytes(value)` 拷贝.
+/// `f` 执行期间持有 buffer 导出, 调用方不得在其中执行可能修改该对象的 Python 代码.
+pub(crate) fn with_buffer_bytes<R>(
+    value: &Bound<'_, PyAny>,
+    f: impl FnOnce(&[u8]) -> R,
+) -> PyResult<Option<R>> {
+    if let Ok(bytes) = value.cast::<PyBytes>() {
+        return Ok(Some(f(bytes.as_bytes())));
+    }
+    if !is_buffer_like(value) {
+        return Ok(None);
+    }
+
+    if let Ok(buffer) = PyBuffer::<u8>::get(value)
+        && buffer.is_c_contiguous()
+    {
+        let len = buffer.len_bytes();
+        if len == 0 {
+            return Ok(Some(f(&[])));
+        }
+        // SAFETY:
+        // buffer 在本作用域内保持导出, 底层内存连续、非空且长度为 len;
+        // 持有 GIL 且 f 不回调 Python, 期间对象不会被修改或释放.
+        let slice = unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, len) };
+        return Ok(Some(f(slice)));
+    }
+
+    Ok(try_coerce_buffer_to_bytes(value)?.map(|bytes| f(bytes.as_bytes())))
+}
+
+/// 判断 memoryview 的导出方是否为不可变的 bytes.
+///
+/// `readonly` 只是视图的属性: `memoryview(bytearray).toreadonly()` 仍指向可变内存,
+/// 因此需检查视图背后的原始对象(`memoryview.obj`).
+fn is_bytes_backed_view(value: &Bound<'_, PyAny>) -> bool {
+    value.is_exact_instance_of::<PyMemoryView>()
+        && value
+            .getattr(intern!(value.py(), "obj"))
+            .is_ok_and(|obj| obj.is_instance_of::<PyBytes>())
+}
+
+/// 以只读切片形式访问待解码的输入, 非 bytes-like 时返回 `None`.
+///
+/// 解码过程中可能执行 Python 代码(`__post_init__`、`default_factory`、校验器、
+/// Enum 构造等), 因此只直接借用 bytes 与导出方为 bytes 的 C 连续 memoryview;
+/// bytearray、mmap 以及背后为可变对象的视图(即便视图本身只读)先拷贝为 bytes,
+/// 避免解码期间底层内存被原地修改.
+pub(crate) fn with_input_bytes<R>(
+    value: &Bound<'_, PyAny>,
+    f: impl FnOnce(&[u8]) -> R,
+) -> PyResult<Option<R>> {
+    if let Ok(bytes) = value.cast::<PyBytes>() {
+        return Ok(Some(f(bytes.as_bytes())));
+    }
+    if !is_buffer_like(value) {
+        return Ok(None);
+    }
+
+    if is_bytes_backed_view(value)
+        && let Ok(buffer) = PyBuffer::<u8>::get(value)
+        && buffer.is_c_contiguous()
+    {
+        let len = buffer.len_bytes();
+        if len == 0 {
+            return Ok(Some(f(&[])));
+        }
+        // SAFETY:
+        // buffer 在本作用域内保持导出, 底层内存连续、非空且长度为 len;
+        // 导出期间视图不能被 release, 且其导出方是不可变的 bytes,
+        // 即使 f 执行 Python 代码, 这段内存也不会被修改或释放.
+        let slice = unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, len) };
+        return Ok(Some(f(slice)));
+    }
+
+    Ok(try_coerce_buffer_to_bytes(value)?.map(|bytes| f(bytes.as_bytes())))
+}
+
 pub(crate) fn dataclass_fields<'py>(
     value: &Bound<'py, PyAny>,
 ) -> PyResult<Option<Bound<'py, PyDict>>> {
@@ -105,17 +187,25 @@ pub(crate) fn class_from_type<'py>(py: Python<'py>, cls: &Py<PyType>) -> Bound<'
     cls.bind(py).clone()
 }
 
+/// 深度检查位于每个容器/字段的编解码入口, 内联后只保留一次比较;
+/// 错误构造放在冷路径中, 不占用调用方的指令缓存.
 #[inline]
 pub fn check_depth(depth: usize) -> PyResult<()> {
     if depth >= MAX_DEPTH {
-        return Err(PyValueError::new_err(format!(
-            "Recursion depth exceeded (max={}, observed={})",
-            MAX_DEPTH, depth
-        )));
+        return Err(depth_exceeded(depth));
     }
     Ok(())
 }
 
+#[cold]
+#[inline(never)]
+fn depth_exceeded(depth: usize) -> PyErr {
+    PyValueError::new_err(format!(
+        "Recursion depth exceeded (max={}, observed={})",
+        MAX_DEPTH, depth
+    ))
+}
+
 pub(crate) struct PySequenceFast {
     ptr: *mut ffi::PyObject,
     len: isize,
@@ -5,7 +5,8 @@ use crate::binding::utils::{class_from_type, dataclass_fields, is_buffer_like};
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyBytes, PyDict, PyFloat, PyFrozenSet, PySequence, PySet, PyString};
 
-#[inline]
+/// 生成错误信息前缀, 仅在校验失败时调用.
+#[cold]
 fn field_prefix(field_name: Option<&str>) -> String {
     match field_name {
         Some(name) => format!("Field '{}'", name),
@@ -28,14 +29,14 @@ pub(crate) fn validate_numeric_constraints_raw(
     constraints: &Constraints,
     field_name: Option<&str>,
 ) -> PyResult<()> {
-    let label = field_prefix(field_name);
-
     if let Some(gt) = constraints.gt
         && value.partial_cmp(&gt) != Some(std::cmp::Ordering::Greater)
     {
         return Err(ValidationError::new_err(format!(
             "{} must be > {}, got {}",
-            label, gt, value
+            field_prefix(field_name),
+            gt,
+            value
         )));
     }
     if let Some(ge) = constraints.ge
@@ -46,7 +47,9 @@ pub(crate) fn validate_numeric_constraints_raw(
     {
         return Err(ValidationError::new_err(format!(
             "{} must be >= {}, got {}",
-            label, ge, value
+            field_prefix(field_name),
+            ge,
+            value
         )));
     }
     if let Some(lt) = constraints.lt
@@ -54,7 +57,9 @@ pub(crate) fn validate_numeric_constraints_raw(
     {
         return Err(ValidationError::new_err(format!(
             "{} must be < {}, got {}",
-            label, lt, value
+            field_prefix(field_name),
+            lt,
+            value
         )));
     }
     if let Some(le) = constraints.le
@@ -65,7 +70,9 @@ pub(crate) fn validate_numeric_constraints_raw(
     {
         return Err(ValidationError::new_err(format!(
             "{} must be <= {}, got {}",
-            label, le, value
+            field_prefix(field_name),
+            le,
+            value
         )));
     }
 
@@ -77,14 +84,14 @@ pub(crate) fn validate_length_constraints_raw(
     constraints: &Constraints,
     field_name: Option<&str>,
 ) -> PyResult<()> {
-    let label = field_prefix(field_name);
-
     if let Some(min_len) = constraints.min_len
         && len < min_len
     {
         return Err(ValidationError::new_err(format!(
             "{} length must be >= {}, got {}",
-            label, min_len, len
+            field_prefix(field_name),
+            min_len,
+            len
         )));
     }
     if let Some(max_len) = constraints.max_len
@@ -92,7 +99,9 @@ pub(crate) fn validate_length_constraints_raw(
     {
         return Err(ValidationError::new_err(format!(
             "{} length must be <= {}, got {}",
-            label, max_len, len
+            field_prefix(field_name),
+            max_len,
+            len
         )));
     }
 
@@ -104,13 +113,31 @@ pub(crate) fn validate_constraints_on_value(
     constraints: &Constraints,
     field_name: Option<&str>,
 ) -> PyResult<()> {
-    let label = field_prefix(field_name);
+    validate_constraints_impl(value, constraints, field_name, true)
+}
+
+/// 校验除数值范围以外的约束.
+///
+/// 用于解码时数值已在读取阶段以原生值校验过的字段, 避免再从 Python 对象提取一次 f64.
+pub(crate) fn validate_non_numeric_constraints_on_value(
+    value: &Bound<'_, PyAny>,
+    constraints: &Constraints,
+    field_name: Option<&str>,
+) -> PyResult<()> {
+    validate_constraints_impl(value, constraints, field_name, false)
+}
 
-    if has_numeric_constraints(constraints) {
+fn validate_constraints_impl(
+    value: &Bound<'_, PyAny>,
+    constraints: &Constraints,
+    field_name: Option<&str>,
+    check_numeric: bool,
+) -> PyResult<()> {
+    if check_numeric && has_numeric_constraints(constraints) {
         let numeric: f64 = value.extract().map_err(|_| {
             ValidationError::new_err(format!(
                 "{} must be a number to apply numeric constraints",
-                label
+                field_prefix(field_name)
             ))
         })?;
         validate_numeric_constraints_raw(numeric, constraints, field_name)?;
@@ -120,7 +147,7 @@ pub(crate) fn validate_constraints_on_value(
         let len = value.len().map_err(|_| {
             ValidationError::new_err(format!(
                 "{} must have length to apply length constraints",
-                label
+                field_prefix(field_name)
             ))
         })?;
         validate_length_constraints_raw(len, constraints, field_name)?;
@@ -133,7 +160,7 @@ pub(crate) fn validate_constraints_on_value(
         if matched.is_none() {
             return Err(ValidationError::new_err(format!(
                 "{} does not match pattern",
-                label
+                field_prefix(field_name)
             )));
         }
     }
@@ -141,6 +168,21 @@ pub(crate) fn validate_constraints_on_value(
     Ok(())
 }
 
+/// 判断值能否按 i64 编码.
+///
+/// Union 变体匹配时常以 str/float/bytes 试探整数分支; 这些类型一次类型检查即可判否,
+/// 不必经 extract 构造再丢弃 TypeError. 其余对象仍按 `__index__` 语义提取.
+#[inline]
+fn fits_i64(value: &Bound<'_, PyAny>) -> bool {
+    if value.is_instance_of::<PyString>()
+        || value.is_instance_of::<PyFloat>()
+        || value.is_instance_of::<PyBytes>()
+    {
+        return false;
+    }
+    value.extract::<i64>().is_ok()
+}
+
 pub(crate) fn value_matches_type<'py>(
     py: Python<'py>,
     typ: &TypeExpr,
@@ -154,11 +196,11 @@ pub(crate) fn value_matches_type<'py>(
                 if value.is_instance_of::<pyo3::types::PyBool>() {
                     Ok(false)
                 } else {
-                    Ok(value.extract::<i64>().is_ok())
+                    Ok(fits_i64(value))
                 }
             }
             WireType::Bool => Ok(value.is_instance_of::<pyo3::types::PyBool>()),
-            WireType::Long => Ok(value.extract::<i64>().is_ok()),
+            WireType::Long => Ok(fits_i64(value)),
             WireType::Float | WireType::Double => Ok(value.is_instance_of::<PyFloat>()),
             WireType::String => Ok(value.is_instance_of::<PyString>()),
             _ => Ok(false),
@@ -36,6 +36,29 @@ pub enum TarsType {
     SimpleList = 13,
 }
 
+impl TarsType {
+    /// 类型名(与 `Debug` 输出一致), 以静态字符串返回, 无需格式化与分配.
+    #[inline]
+    pub const fn name(self) -> &'static str {
+        match self {
+            TarsType::Int1 => "Int1",
+            TarsType::Int2 => "Int2",
+            TarsType::Int4 => "Int4",
+            TarsType::Int8 => "Int8",
+            TarsType::Float => "Float",
+            TarsType::Double => "Double",
+            TarsType::String1 => "String1",
+            TarsType::String4 => "String4",
+            TarsType::Map => "Map",
+            TarsType::List => "List",
+            TarsType::StructBegin => "StructBegin",
+            TarsType::StructEnd => "StructEnd",
+            TarsType::ZeroTag => "ZeroTag",
+            TarsType::SimpleList => "SimpleList",
+        }
+    }
+}
+
 impl TryFrom<u8> for TarsType {
     type Error = u8;
 
@@ -89,4 +112,12 @@ mod tests {
         assert_eq!(TarsType::try_from(13), Ok(TarsType::SimpleList));
         assert_eq!(TarsType::try_from(14), Err(14));
     }
+
+    #[test]
+    fn test_tars_type_name_matches_debug_output() {
+        for v in 0..=13u8 {
+            let t = TarsType::try_from(v).unwrap();
+            assert_eq!(t.name(), format!("{:?}", t));
+        }
+    }
 }
@@ -58,13 +58,24 @@ impl<'a> TarsReader<'a> {
         }
     }
 
+    /// 读取定长字节数组.
+    ///
+    /// 越界检查发生在游标前进之前, 错误中的 offset 即为调用时的位置,
+    /// 调用方无需再修正. `first_chunk` 将长度检查与定长切片合并为一次判断,
+    /// 随后按值拷贝出 `[u8; N]` 交给 `from_be_bytes`.
     #[inline]
     fn read_array<const N: usize>(&mut self) -> Result<[u8; N]> {
-        self.ensure_available(N)?;
-        let mut bytes = [0u8; N];
-        bytes.copy_from_slice(&self.data[self.pos..self.pos + N]);
-        self.pos += N;
-        Ok(bytes)
+        match self.remaining().first_chunk::<N>() {
+            Some(bytes) => {
+                self.pos += N;
+                Ok(*bytes)
+            }
+            None => Err(Error::buffer_overflow(
+                self.pos,
+                N,
+                self.data.len().saturating_sub(self.pos),
+            )),
+        }
     }
 
     /// 读取字段头部信息 (Tag 和 Type).
@@ -121,48 +132,20 @@ impl<'a> TarsReader<'a> {
         let start_pos = self.pos;
         match type_id {
             TarsType::ZeroTag => Ok(0),
-            TarsType::Int1 => {
-                self.ensure_available(1).map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
-                let v = self.data[self.pos] as i8;
-                self.pos += 1;
-                Ok(v as i64)
-            }
+            // `as i8` 即为无分支的符号扩展
+            TarsType::Int1 => Ok(self.read_u8()? as i8 as i64),
             TarsType::Int2 => {
-                let bytes = self.read_array::<2>().map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
+                let bytes = self.read_array::<2>()?;
                 let v = i16::from_be_bytes(bytes);
                 Ok(v as i64)
             }
             TarsType::Int4 => {
-                let bytes = self.read_array::<4>().map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
+                let bytes = self.read_array::<4>()?;
                 let v = i32::from_be_bytes(bytes);
                 Ok(v as i64)
             }
             TarsType::Int8 => {
-                let bytes = self.read_array::<8>().map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
+                let bytes = self.read_array::<8>()?;
                 let v = i64::from_be_bytes(bytes);
                 Ok(v)
             }
@@ -179,48 +162,19 @@ impl<'a> TarsReader<'a> {
         let start_pos = self.pos;
         match type_id {
             TarsType::ZeroTag => Ok(0),
-            TarsType::Int1 => {
-                self.ensure_available(1).map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
-                let v = self.data[self.pos];
-                self.pos += 1;
-                Ok(v as u64)
-            }
+            TarsType::Int1 => Ok(self.read_u8()? as u64),
             TarsType::Int2 => {
-                let bytes = self.read_array::<2>().map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
+                let bytes = self.read_array::<2>()?;
                 let v = u16::from_be_bytes(bytes);
                 Ok(v as u64)
             }
             TarsType::Int4 => {
-                let bytes = self.read_array::<4>().map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
+                let bytes = self.read_array::<4>()?;
                 let v = u32::from_be_bytes(bytes);
                 Ok(v as u64)
             }
             TarsType::Int8 => {
-                let bytes = self.read_array::<8>().map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
+                let bytes = self.read_array::<8>()?;
                 let v = u64::from_be_bytes(bytes);
                 Ok(v)
             }
@@ -312,14 +266,7 @@ impl<'a> TarsReader<'a> {
         match type_id {
             TarsType::ZeroTag => Ok(0.0),
             TarsType::Float => {
-                let start_pos = self.pos;
-                let bytes = self.read_array::<4>().map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
+                let bytes = self.read_array::<4>()?;
                 let v = f32::from_be_bytes(bytes);
                 Ok(v)
             }
@@ -337,14 +284,7 @@ impl<'a> TarsReader<'a> {
             TarsType::ZeroTag => Ok(0.0),
             TarsType::Float => self.read_float(type_id).map(|v| v as f64),
             TarsType::Double => {
-                let start_pos = self.pos;
-                let bytes = self.read_array::<8>().map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
+                let bytes = self.read_array::<8>()?;
                 let v = f64::from_be_bytes(bytes);
                 Ok(v)
             }
@@ -364,25 +304,13 @@ impl<'a> TarsReader<'a> {
 
         let len = match type_id {
             TarsType::String1 => {
-                self.ensure_available(1).map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
+                self.ensure_available(1)?;
                 let l = self.data[self.pos] as usize;
                 self.pos += 1;
                 l
             }
             TarsType::String4 => {
-                let bytes = self.read_array::<4>().map_err(|e| {
-                    let mut e = e;
-                    if let Error::BufferOverflow { offset, .. } = &mut e {
-                        *offset = start_pos;
-                    }
-                    e
-                })?;
+                let bytes = self.read_array::<4>()?;
                 u32::from_be_bytes(bytes) as usize
             }
             _ => {
@@ -432,21 +360,31 @@ impl<'a> TarsReader<'a> {
     }
 
     /// 读取字节数组(零拷贝).
+    ///
+    /// 只前移游标并返回借用切片, 不搬移底层数据.
     #[inline]
     pub fn read_bytes(&mut self, len: usize) -> Result<&'a [u8]> {
-        self.ensure_available(len)?;
-        let slice = &self.data[self.pos..self.pos + len];
-        self.pos += len;
-        Ok(slice)
+        let remaining = self.remaining();
+        match remaining.get(..len) {
+            Some(slice) => {
+                self.pos += len;
+                Ok(slice)
+            }
+            None => Err(Error::buffer_overflow(self.pos, len, remaining.len())),
+        }
     }
 
     /// 读取一个字节.
     #[inline]
     pub fn read_u8(&mut self) -> Result<u8> {
-        self.ensure_available(1)?;
-        let v = self.data[self.pos];
-        self.pos += 1;
-        Ok(v)
+        // 越界检查与取值合并为一次 `get`, 避免 ensure_available 后再做一次下标检查
+        match self.data.get(self.pos) {
+            Some(&v) => {
+                self.pos += 1;
+                Ok(v)
+            }
+            None => Err(Error::buffer_overflow(self.pos, 1, 0)),
+        }
     }
 
     /// 读取 Tars 容器的大小(List/Map/SimpleList 长度).
@@ -527,6 +465,23 @@ mod tests {
         assert_eq!(reader.read_int(TarsType::ZeroTag).unwrap(), 0);
     }
 
+    #[test]
+    fn test_read_int1_sign_extends_full_byte_range() {
+        let data = [0x7F, 0x80, 0xFF];
+        let mut reader = TarsReader::new(&data);
+        assert_eq!(reader.read_int(TarsType::Int1).unwrap(), 127);
+        assert_eq!(reader.read_int(TarsType::Int1).unwrap(), -128);
+        assert_eq!(reader.read_int(TarsType::Int1).unwrap(), -1);
+        assert!(matches!(
+            reader.read_int(TarsType::Int1),
+            Err(Error::BufferOverflow {
+                offset: 3,
+                required: 1,
+                available: 0
+            })
+        ));
+    }
+
     #[test]
     fn test_read_int_with_non_integer_type_returns_semantic_error() {
         let data = [];
@@ -2,6 +2,52 @@ use crate::codec::consts::TarsType;
 
 use bytes::BufMut;
 
+/// 单个标量值编码后的最大长度: 2 字节头部 + 8 字节 payload.
+const MAX_SCALAR_LEN: usize = 10;
+
+/// 内联写出的短字符串长度上限, 不超过该长度时头部与内容合并为一次写入.
+const SHORT_STRING_INLINE_LEN: usize = 64;
+
+/// SimpleList 前导的最大长度: 2 字节头部 + 1 字节元素类型 + 长度整数.
+const MAX_BYTES_PRELUDE_LEN: usize = 3 + MAX_SCALAR_LEN;
+
+/// 将头部编码到缓冲区起始处, 返回头部字节数.
+#[inline(always)]
+fn encode_head(buf: &mut [u8], tag: u8, type_id: TarsType) -> usize {
+    let type_val = type_id as u8;
+    if tag < 15 {
+        buf[0] = (tag << 4) | type_val;
+        1
+    } else {
+        buf[0] = (15 << 4) | type_val;
+        buf[1] = tag;
+        2
+    }
+}
+
+/// 将整数(头部 + 最小宽度大端 payload)编码到缓冲区起始处, 返回写入字节数.
+#[inline(always)]
+fn encode_int(buf: &mut [u8], tag: u8, value: i64) -> usize {
+    if value == 0 {
+        return encode_head(buf, tag, TarsType::ZeroTag);
+    }
+    let bytes = value.to_be_bytes();
+    // 截断后符号扩展仍等于原值即说明落在该宽度内, 每档只需一次比较
+    let (type_id, payload) = if value as i8 as i64 == value {
+        (TarsType::Int1, &bytes[7..])
+    } else if value as i16 as i64 == value {
+        (TarsType::Int2, &bytes[6..])
+    } else if value as i32 as i64 == value {
+        (TarsType::Int4, &bytes[4..])
+    } else {
+        (TarsType::Int8, &bytes[..])
+    };
+    let head_len = encode_head(buf, tag, type_id);
+    let end = head_len + payload.len();
+    buf[head_len..end].copy_from_slice(payload);
+    end
+}
+
 /// Tars 数据流编码器(写入器).
 ///
 /// 用于将 Rust 数据类型序列化为 Tars 二进制格式.
@@ -61,37 +107,34 @@ impl<B: BufMut> TarsWriter<B> {
         let type_val = type_id as u8;
         if tag < 15 {
             // 低 4 位是类型,高 4 位是标签
-            let header = (tag << 4) | type_val;
-            self.buffer.put_u8(header);
+            self.buffer.put_u8((tag << 4) | type_val);
         } else {
-            // 高 4 位全 1(15),接着写入标签字节,低 4 位是类型
-            let header = (15 << 4) | type_val;
-            self.buffer.put_u8(header);
-            self.buffer.put_u8(tag);
+            // 高 4 位全 1(15),接着写入标签字节,低 4 位是类型; 两字节一次写出
+            self.buffer.put_slice(&[(15 << 4) | type_val, tag]);
         }
     }
 
+    /// 以一次 `put_slice` 写入头部与定长 payload.
+    ///
+    /// 头部与大端 payload 先在栈上拼装, 避免对底层缓冲区做多次容量检查.
+    #[inline(always)]
+    fn write_scalar(&mut self, tag: u8, type_id: TarsType, payload: &[u8]) {
+        let mut buf = [0u8; MAX_SCALAR_LEN];
+        let head_len = encode_head(&mut buf, tag, type_id);
+        let end = head_len + payload.len();
+        buf[head_len..end].copy_from_slice(payload);
+        self.buffer.put_slice(&buf[..end]);
+    }
+
     /// 写入整数(自动选择最小宽度).
     ///
     /// 根据数值大小自动选择 Int1、Int2、Int4、Int8 或 ZeroTag 类型.
     /// 这是 Tars 协议的一种压缩优化.
     #[inline]
     pub fn write_int(&mut self, tag: u8, value: i64) {
-        if value == 0 {
-            self.write_tag(tag, TarsType::ZeroTag);
-        } else if value >= i8::MIN as i64 && value <= i8::MAX as i64 {
-            self.write_tag(tag, TarsType::Int1);
-            self.buffer.put_u8(value as u8);
-        } else if value >= i16::MIN as i64 && value <= i16::MAX as i64 {
-            self.write_tag(tag, TarsType::Int2);
-            self.buffer.put_i16(value as i16);
-        } else if value >= i32::MIN as i64 && value <= i32::MAX as i64 {
-            self.write_tag(tag, TarsType::Int4);
-            self.buffer.put_i32(value as i32);
-        } else {
-            self.write_tag(tag, TarsType::Int8);
-            self.buffer.put_i64(value);
-        }
+        let mut buf = [0u8; MAX_SCALAR_LEN];
+        let len = encode_int(&mut buf, tag, value);
+        self.buffer.put_slice(&buf[..len]);
     }
 
     /// 写入单精度浮点数.
@@ -101,8 +144,7 @@ impl<B: BufMut> TarsWriter<B> {
             self.write_tag(tag, TarsType::ZeroTag);
             return;
         }
-        self.write_tag(tag, TarsType::Float);
-        self.buffer.put_f32(value);
+        self.write_scalar(tag, TarsType::Float, &value.to_be_bytes());
     }
 
     /// 写入双精度浮点数.
@@ -112,8 +154,7 @@ impl<B: BufMut> TarsWriter<B> {
             self.write_tag(tag, TarsType::ZeroTag);
             return;
         }
-        self.write_tag(tag, TarsType::Double);
-        self.buffer.put_f64(value);
+        self.write_scalar(tag, TarsType::Double, &value.to_be_bytes());
     }
 
     /// 写入字符串.
@@ -121,12 +162,21 @@ impl<B: BufMut> TarsWriter<B> {
     pub fn write_string(&mut self, tag: u8, value: &str) {
         let bytes = value.as_bytes();
         let len = bytes.len();
+        if len <= SHORT_STRING_INLINE_LEN {
+            // 短字符串(最常见的情况): 头部、长度与内容在栈上拼装后一次写出
+            let mut buf = [0u8; 3 + SHORT_STRING_INLINE_LEN];
+            let head_len = encode_head(&mut buf, tag, TarsType::String1);
+            buf[head_len] = len as u8;
+            let start = head_len + 1;
+            buf[start..start + len].copy_from_slice(bytes);
+            self.buffer.put_slice(&buf[..start + len]);
+            return;
+        }
+        // 头部与长度前缀合并为一次写入, 随后写入内容
         if len <= 255 {
-            self.write_tag(tag, TarsType::String1);
-            self.buffer.put_u8(len as u8);
+            self.write_scalar(tag, TarsType::String1, &[len as u8]);
         } else {
-            self.write_tag(tag, TarsType::String4);
-            self.buffer.put_u32(len as u32);
+            self.write_scalar(tag, TarsType::String4, &(len as u32).to_be_bytes());
         }
         self.buffer.put_slice(bytes);
     }
@@ -134,11 +184,13 @@ impl<B: BufMut> TarsWriter<B> {
     /// 写入字节数组(SimpleList).
     #[inline]
     pub fn write_bytes(&mut self, tag: u8, value: &[u8]) {
-        self.write_tag(tag, TarsType::SimpleList);
-        // 元素类型字节:0 表示字节
-        self.buffer.put_u8(0);
-        // 写入长度,使用 write_int(Tag 0)
-        self.write_int(0, value.len() as i64);
+        // 头部、元素类型字节(0 表示字节)与长度(Tag 0 的整数)在栈上拼装后一次写出
+        let mut buf = [0u8; MAX_BYTES_PRELUDE_LEN];
+        let mut pos = encode_head(&mut buf, tag, TarsType::SimpleList);
+        buf[pos] = 0;
+        pos += 1;
+        pos += encode_int(&mut buf[pos..], 0, value.len() as i64);
+        self.buffer.put_slice(&buf[..pos]);
         self.buffer.put_slice(value);
     }
 }
@@ -182,6 +234,20 @@ mod tests {
         assert_eq!(writer.get_buffer(), b"\x01\x01\x00"); // 标签 0,Int2,值 256(0x0100)
     }
 
+    /// 验证各宽度整数与浮点数的头部和大端 payload 布局.
+    #[test]
+    fn test_write_scalar_widths_produce_big_endian_payload() {
+        let mut writer = TarsWriter::new();
+        writer.write_int(1, -1);
+        writer.write_int(2, 70000);
+        writer.write_int(3, i64::MIN);
+        writer.write_double(20, 1.5);
+        assert_eq!(
+            writer.get_buffer(),
+            b"\x10\xff\x22\x00\x01\x11\x70\x33\x80\x00\x00\x00\x00\x00\x00\x00\xf5\x14\x3f\xf8\x00\x00\x00\x00\x00\x00"
+        );
+    }
+
     /// 验证字符串的编码布局,包含 Tag、类型标记、长度及内容.
     #[test]
     fn test_write_string_with_short_value_produces_string1_type() {
@@ -190,6 +256,50 @@ mod tests {
         assert_eq!(writer.get_buffer(), b"\x06\x01\x61"); // 标签 0,String1,长度 1,'a'
     }
 
+    /// 验证超过 255 字节的字符串使用 String4 与 4 字节长度前缀.
+    #[test]
+    fn test_write_string_with_long_value_produces_string4_type() {
+        let mut writer = TarsWriter::new();
+        let value = "x".repeat(256);
+        writer.write_string(0, &value);
+        let buf = writer.get_buffer();
+        assert_eq!(&buf[..5], b"\x07\x00\x00\x01\x00"); // 标签 0,String4,长度 256
+        assert_eq!(&buf[5..], value.as_bytes());
+    }
+
+    /// 验证短字符串内联路径与常规路径在边界长度上的编码布局一致.
+    #[test]
+    fn test_write_string_around_inline_threshold() {
+        for len in [0, 1, SHORT_STRING_INLINE_LEN, SHORT_STRING_INLINE_LEN + 1] {
+            let value = "a".repeat(len);
+            let mut writer = TarsWriter::new();
+            writer.write_string(16, &value);
+            let buf = writer.get_buffer();
+            assert_eq!(&buf[..3], &[0xf6, 0x10, len as u8]);
+            assert_eq!(&buf[3..], value.as_bytes());
+        }
+    }
+
+    /// 验证各宽度边界值选择的类型与小整数头部+payload 的两字节布局.
+    #[test]
+    fn test_write_int_width_boundaries() {
+        let cases: [(i64, &[u8]); 8] = [
+            (-1, b"\x00\xff"),
+            (i8::MAX as i64, b"\x00\x7f"),
+            (i8::MIN as i64, b"\x00\x80"),
+            (i8::MAX as i64 + 1, b"\x01\x00\x80"),
+            (i16::MIN as i64, b"\x01\x80\x00"),
+            (i16::MAX as i64 + 1, b"\x02\x00\x00\x80\x00"),
+            (i32::MIN as i64, b"\x02\x80\x00\x00\x00"),
+            (i32::MAX as i64 + 1, b"\x03\x00\x00\x00\x00\x80\x00\x00\x00"),
+        ];
+        for (value, expected) in cases {
+            let mut writer = TarsWriter::new();
+            writer.write_int(0, value);
+            assert_eq!(writer.get_buffer(), expected, "value={value}");
+        }
+    }
+
     /// 验证二进制字节数组的编码布局,遵循 SimpleList 规范.
     #[test]
     fn test_write_bytes_with_valid_data_produces_simple_list_type() {
@@ -198,6 +308,21 @@ mod tests {
         assert_eq!(writer.get_buffer(), b"\x0d\x00\x00\x03abc");
     }
 
+    /// 验证字节数组前导在空值、长度跨宽度及高 Tag 时的编码布局.
+    #[test]
+    fn test_write_bytes_prelude_with_various_lengths_and_tags() {
+        let mut writer = TarsWriter::new();
+        writer.write_bytes(1, b"");
+        assert_eq!(writer.get_buffer(), b"\x1d\x00\x0c");
+
+        let payload = vec![0xAB; 300];
+        let mut writer = TarsWriter::new();
+        writer.write_bytes(20, &payload);
+        let buf = writer.get_buffer();
+        assert_eq!(&buf[..6], b"\xfd\x14\x00\x01\x01\x2c");
+        assert_eq!(&buf[6..], &payload[..]);
+    }
+
     /// 验证当 Tag >= 15 时,编码器是否正确生成双字节扩展头部.
     #[test]
     fn test_write_int_with_high_tag_produces_expanded_header() {